@@ -2,18 +2,41 @@
 # Path: Scripts/Database/BookViewer.py
 # Standard: AIDEV-PascalCase-1.8
 # Created: 2025-07-03
-# Last Modified: 2025-07-03  08:45PM
+# Last Modified: 2026-10-15  09:00AM
 """
 Description: Enhanced Book Viewer - Special focus on Keywords, Category, Thumbnail
 Clean, reliable solution for Anderson's Library book display with enhanced
 classification and asset analysis capabilities.
 
+Required indexes: Books(HasThumbnail) and Books(CategoryID) - see
+Data/Databases/MySQL/BookViewerIndexes.sql
+
 Author: Herb Bowers - Project Himalaya
 Contact: HimalayaProject1@gmail.com
 """
 
-import mysql.connector
+import functools
+import itertools
+import json
+import pickle
+import sqlite3
 import sys
+import time
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+# mysql.connector is imported on first database use so usage/help stay fast
+if TYPE_CHECKING:
+    import mysql.connector.pooling
+
+# Optional fast JSON encoder for --json output
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # MySQL Configuration
 MYSQL_CONFIG = {
@@ -25,241 +48,724 @@ MYSQL_CONFIG = {
     'charset': 'utf8mb4'
 }
 
-def ViewBook(BookId: int) -> None:
+# Connection pool settings
+POOL_NAME = 'BookViewerPool'
+POOL_SIZE = 5
+
+# Enhanced query with subject, category, and thumbnail focus
+# Note: Removed database_subject as column doesn't exist
+BOOK_RECORD_SQL = """
+    SELECT 
+        B.BookID,
+        B.FileName,
+        B.Title,
+        A.AuthorName,
+        P.PublisherName,
+        B.CategoryID,
+        B.ExtractedKeywords,
+        B.PublicationYear,
+        B.PageCount,
+        B.FileSizeMB,
+        B.Language,
+        B.PrimaryISBN,
+        B.HasCover,
+        B.HasThumbnail,
+        B.AccessLevel,
+        B.DateModified
+    FROM Books B
+    LEFT JOIN Authors A ON B.AuthorID = A.AuthorID
+    LEFT JOIN Publishers P ON B.PublisherID = P.PublisherID
+"""
+VIEW_BOOK_SQL = BOOK_RECORD_SQL + "    WHERE B.BookID = %s\n"
+
+# Primary-key lookup that tells whether cached book rows are still current
+BOOK_MODIFIED_SQL = "SELECT BookID, DateModified FROM Books WHERE BookID IN ({})"
+
+# Largest IN (...) list sent per query, keeps batches well under max_allowed_packet
+VIEW_BATCH_SIZE = 500
+
+# Listing output is buffered and written this many lines at a time
+OUTPUT_CHUNK_LINES = 64
+
+# Enhanced query to show category and thumbnail in listing
+LIST_BOOKS_SQL = """
+    SELECT 
+        B.BookID,
+        IF(CHAR_LENGTH(B.Title) > 28, CONCAT(LEFT(B.Title, 28), '..'), B.Title) AS TitleShort,
+        IF(CHAR_LENGTH(A.AuthorName) > 12, CONCAT(LEFT(A.AuthorName, 12), '..'), A.AuthorName) AS AuthorShort,
+        B.CategoryID,
+        B.HasThumbnail
+    FROM Books B
+    LEFT JOIN Authors A ON B.AuthorID = A.AuthorID
+    ORDER BY BookID 
+    LIMIT 60
+"""
+
+# Up to three sample books per category, ranked server-side
+CATEGORY_SUMMARY_SQL = """
+    WITH Ranked AS (
+        SELECT 
+            CategoryID,
+            BookID,
+            LEFT(Title, 30) AS Title,
+            ROW_NUMBER() OVER (PARTITION BY CategoryID ORDER BY BookID) AS SampleRank,
+            COUNT(*) OVER (PARTITION BY CategoryID) AS BookCount
+        FROM Books
+    )
+    SELECT CategoryID, BookCount, BookID, Title
+    FROM Ranked
+    WHERE SampleRank <= 3
+    ORDER BY BookCount DESC, CategoryID, SampleRank
+"""
+
+THUMBNAIL_COUNTS_SQL = "SELECT HasThumbnail, COUNT(*) FROM Books GROUP BY HasThumbnail"
+
+THUMBNAIL_SAMPLE_SIZE = 10
+THUMBNAIL_SAMPLE_SQL = """
+    SELECT BookID, IF(CHAR_LENGTH(Title) > 50, CONCAT(LEFT(Title, 50), '...'), Title) AS TitleShort
+    FROM Books 
+    WHERE HasThumbnail = %s 
+    ORDER BY BookID 
+    LIMIT %s
+"""
+
+# Small, rarely-changing lookup resolved client-side instead of joined per query
+CATEGORY_NAMES_SQL = "SELECT CategoryID, CategoryName FROM Categories"
+
+# Shown in place of empty book record fields
+BOOK_FIELD_DEFAULTS = {
+    'CategoryName': 'Uncategorized',
+    'ExtractedKeywords': 'Not Specified',
+    'Title': 'Unknown',
+    'AuthorName': 'Unknown',
+    'PublisherName': 'Unknown',
+    'PublicationYear': 'Unknown',
+    'FileName': 'Unknown',
+    'PageCount': 'Unknown',
+    'FileSizeMB': 'Unknown',
+    'Language': 'Unknown',
+    'PrimaryISBN': 'Not Available',
+    'AccessLevel': 'Unknown',
+}
+
+# Result caching - the catalog is read-mostly
+BOOK_CACHE_SIZE = 512
+QUERY_CACHE_TTL = 60  # seconds before a cached listing is re-queried
+
+# Persistent book cache so repeat CLI runs skip the full book query (one DateModified check instead)
+DISK_CACHE_PATH = Path.home() / '.cache' / 'bookviewer.sqlite'
+DISK_CACHE_TTL = 24 * 60 * 60  # backstop age limit; hits are also checked against Books.DateModified
+DISK_CACHE_VERSION = 3  # bump when the cached row layout changes
+DISK_CACHE_ERRORS = (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError, ValueError, TypeError)
+
+_ConnectionPool = None
+_SharedConnection = None  # pooled connection reused inside a SharedConnection() block
+_ShareConnection = False
+_PreparedCursors = {}  # (SQL text, cursor options) -> prepared cursor on the shared connection
+_QueryCache = {}
+_DiskCache = None
+_UseDiskCache = True
+_DiskCacheWarned = False
+
+def GetConnectionPool() -> 'mysql.connector.pooling.MySQLConnectionPool':
+    """Create the shared MySQL connection pool on first use and return it"""
+    global _ConnectionPool
+    if _ConnectionPool is None:
+        import mysql.connector.pooling
+        _ConnectionPool = mysql.connector.pooling.MySQLConnectionPool(
+            pool_name=POOL_NAME,
+            pool_size=POOL_SIZE,
+            **MYSQL_CONFIG
+        )
+    return _ConnectionPool
+
+@contextmanager
+def SharedConnection():
     """
-    Display a single book in maintenance format with special focus on
-    Keywords, Category, and Thumbnail information
+    Make every GetCursor() call inside the block reuse one pooled connection.
+    The connection is checked out on first use, so a block that is answered
+    entirely from cache never connects, and is returned to the pool on exit.
+    """
+    global _SharedConnection, _ShareConnection
+    _ShareConnection = True
+    try:
+        yield
+    finally:
+        _ShareConnection = False
+        for Cursor in _PreparedCursors.values():
+            Cursor.close()
+        _PreparedCursors.clear()
+        if _SharedConnection is not None:
+            _SharedConnection.close()
+            _SharedConnection = None
+
+def _GetSharedConnection():
+    """Return the SharedConnection() block's connection, checking it out on first use"""
+    global _SharedConnection
+    if _SharedConnection is None:
+        _SharedConnection = GetConnectionPool().get_connection()
+    return _SharedConnection
+
+@contextmanager
+def GetCursor(**CursorOptions):
+    """
+    Check a connection out of the pool (or reuse the SharedConnection() one)
+    and yield (Connection, Cursor). The cursor is closed on exit and a
+    connection checked out here is returned to the pool.
     
     Args:
-        BookId: Book ID to display
+        **CursorOptions: Keyword arguments passed through to Connection.cursor()
     """
+    if _ShareConnection:
+        Connection = _GetSharedConnection()
+    else:
+        Connection = GetConnectionPool().get_connection()
+    
     try:
-        Connection = mysql.connector.connect(**MYSQL_CONFIG)
-        Cursor = Connection.cursor()
-        
-        # Enhanced query with subject, category, and thumbnail focus
-        # Note: Removed database_subject as column doesn't exist
-        Cursor.execute("""
-            SELECT 
-                B.BookID,
-                B.FileName,
-                B.Title,
-                A.AuthorName,
-                P.PublisherName,
-                C.CategoryName,
-                B.ExtractedKeywords,
-                B.PublicationYear,
-                B.PageCount,
-                B.FileSizeMB,
-                B.Language,
-                B.PrimaryISBN,
-                B.HasCover,
-                B.HasThumbnail,
-                B.AccessLevel
-            FROM Books B
-            LEFT JOIN Authors A ON B.AuthorID = A.AuthorID
-            LEFT JOIN Publishers P ON B.PublisherID = P.PublisherID
-            LEFT JOIN Categories C ON B.CategoryID = C.CategoryID
-            WHERE B.BookID = %s
-        """, (BookId,))
+        Cursor = Connection.cursor(**CursorOptions)
+        try:
+            yield Connection, Cursor
+        finally:
+            Cursor.close()
+    finally:
+        if Connection is not _SharedConnection:
+            Connection.close()
+
+@contextmanager
+def GetPreparedCursor(Sql: str, **CursorOptions):
+    """
+    Yield a prepared cursor for Sql. Inside a SharedConnection() block the
+    cursor is kept per SQL text, so the statement is prepared on the server
+    once and every later execution only sends bind values. Outside a block
+    this is a one-off prepared cursor from GetCursor().
+    
+    Args:
+        Sql: Statement the cursor will execute
+        **CursorOptions: Extra keyword arguments for Connection.cursor()
+    """
+    if not _ShareConnection:
+        with GetCursor(prepared=True, **CursorOptions) as (Connection, Cursor):
+            yield Cursor
+        return
+    
+    CacheKey = (Sql, tuple(sorted(CursorOptions.items())))
+    Cursor = _PreparedCursors.get(CacheKey)
+    if Cursor is None:
+        Cursor = _GetSharedConnection().cursor(prepared=True, **CursorOptions)
+        _PreparedCursors[CacheKey] = Cursor
+    yield Cursor
+
+def _IterCachedRows(CacheKey: str, Sql: str) -> Iterator[tuple]:
+    """
+    Yield rows for a parameterless listing query. A result cached within
+    QUERY_CACHE_TTL seconds is replayed; otherwise rows are streamed from an
+    unbuffered cursor as they arrive and cached once fully read.
+    
+    Args:
+        CacheKey: Name the result is cached under
+        Sql: Query to execute on a cache miss
+    """
+    Cached = _QueryCache.get(CacheKey)
+    if Cached and time.monotonic() - Cached[0] < QUERY_CACHE_TTL:
+        yield from Cached[1]
+        return
+    
+    Rows = []
+    with GetCursor(buffered=False) as (Connection, Cursor):
+        Cursor.execute(Sql)
+        for Row in Cursor:
+            Rows.append(Row)
+            yield Row
+    
+    _QueryCache[CacheKey] = (time.monotonic(), Rows)
+
+def _GetDiskCache() -> Optional[sqlite3.Connection]:
+    """Open the on-disk book cache on first use; None when disabled or unavailable"""
+    global _DiskCache, _UseDiskCache
+    if not _UseDiskCache:
+        return None
+    if _DiskCache is None:
+        try:
+            DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _DiskCache = sqlite3.connect(DISK_CACHE_PATH)
+            _DiskCache.execute("""
+                CREATE TABLE IF NOT EXISTS BookCache (
+                    BookID INTEGER PRIMARY KEY,
+                    FetchedAt INTEGER NOT NULL,
+                    Payload BLOB NOT NULL
+                )
+            """)
+        except (sqlite3.Error, OSError) as CacheError:
+            print(f"⚠️ Book cache disabled: {CacheError}", file=sys.stderr)
+            _UseDiskCache = False
+            return None
+    return _DiskCache
+
+def _WarnDiskCache(Action: str, CacheError: Exception) -> None:
+    """Report a book cache read/write failure on stderr, once per run"""
+    global _DiskCacheWarned
+    if not _DiskCacheWarned:
+        print(f"⚠️ Book cache {Action} failed, using MySQL: {CacheError}", file=sys.stderr)
+        _DiskCacheWarned = True
+
+def _ReadDiskCache(BookIds: List[int]) -> Dict[int, dict]:
+    """
+    Return cached rows for the given Book IDs that are unchanged in MySQL.
+    A locked cache file or an unreadable payload counts as a miss, never as
+    an error.
+    
+    Args:
+        BookIds: Book IDs to look up
+    """
+    DiskCache = _GetDiskCache()
+    if DiskCache is None or not BookIds:
+        return {}
+    
+    Cached = {}
+    Oldest = int(time.time()) - DISK_CACHE_TTL
+    try:
+        for Start in range(0, len(BookIds), VIEW_BATCH_SIZE):
+            Batch = BookIds[Start:Start + VIEW_BATCH_SIZE]
+            Placeholders = ', '.join(['?'] * len(Batch))
+            for BookId, Payload in DiskCache.execute(
+                    f"SELECT BookID, Payload FROM BookCache WHERE FetchedAt > ? AND BookID IN ({Placeholders})",
+                    (Oldest, *Batch)):
+                try:
+                    Version, Result = pickle.loads(Payload)
+                except DISK_CACHE_ERRORS as CacheError:
+                    _WarnDiskCache("read", CacheError)
+                    continue
+                if Version == DISK_CACHE_VERSION:
+                    Cached[BookId] = Result
+    except DISK_CACHE_ERRORS as CacheError:
+        _WarnDiskCache("read", CacheError)
+    return _DropModifiedBooks(Cached)
+
+def _DropModifiedBooks(Cached: Dict[int, dict]) -> Dict[int, dict]:
+    """
+    Keep only cached rows whose Books.DateModified still matches MySQL; books
+    edited or deleted since they were cached become misses
+    
+    Args:
+        Cached: Rows read from the on-disk cache, keyed by BookID
+    """
+    if not Cached:
+        return Cached
+    
+    CachedIds = list(Cached)
+    Current = {}
+    with GetCursor() as (Connection, Cursor):
+        for Start in range(0, len(CachedIds), VIEW_BATCH_SIZE):
+            Batch = CachedIds[Start:Start + VIEW_BATCH_SIZE]
+            Cursor.execute(BOOK_MODIFIED_SQL.format(', '.join(['%s'] * len(Batch))), tuple(Batch))
+            Current.update(Cursor.fetchall())
+    
+    return {BookId: Result for BookId, Result in Cached.items()
+            if BookId in Current and Current[BookId] == Result.get('DateModified')}
+
+def _WriteDiskCache(Books: Dict[int, dict]) -> None:
+    """
+    Store freshly fetched rows in the on-disk cache
+    
+    Args:
+        Books: Rows keyed by BookID
+    """
+    DiskCache = _GetDiskCache()
+    if DiskCache is None or not Books:
+        return
+    
+    FetchedAt = int(time.time())
+    try:
+        with DiskCache:
+            DiskCache.executemany(
+                "INSERT OR REPLACE INTO BookCache (BookID, FetchedAt, Payload) VALUES (?, ?, ?)",
+                [(BookId, FetchedAt, pickle.dumps((DISK_CACHE_VERSION, Result)))
+                 for BookId, Result in Books.items()]
+            )
+    except (*DISK_CACHE_ERRORS, pickle.PicklingError) as CacheError:
+        _WarnDiskCache("write", CacheError)
+
+@functools.lru_cache(maxsize=1)
+def _CategoryNames() -> dict:
+    """Load the CategoryID -> CategoryName lookup once per process"""
+    with GetCursor() as (Connection, Cursor):
+        Cursor.execute(CATEGORY_NAMES_SQL)
+        return dict(Cursor.fetchall())
+
+def _ResolveCategory(Result: dict, CategoryNames: dict) -> dict:
+    """Replace the CategoryID column of a book row with its CategoryName"""
+    Result['CategoryName'] = CategoryNames.get(Result.pop('CategoryID'))
+    return Result
+
+@functools.lru_cache(maxsize=BOOK_CACHE_SIZE)
+def _FetchBook(BookId: int) -> Optional[dict]:
+    """
+    Fetch a single book row, memoized per BookID for the life of the process
+    and backed by the on-disk cache between runs. The CategoryID column is
+    replaced with its resolved CategoryName.
+    
+    Args:
+        BookId: Book ID to fetch
+    """
+    Cached = _ReadDiskCache([BookId])
+    if BookId in Cached:
+        return Cached[BookId]
+    
+    CategoryNames = _CategoryNames()
+    
+    with GetPreparedCursor(VIEW_BOOK_SQL, dictionary=True) as Cursor:
+        Cursor.execute(VIEW_BOOK_SQL, (BookId,))
+        Rows = Cursor.fetchall()
+    Result = Rows[0] if Rows else None
+    
+    if Result:
+        Result = _ResolveCategory(Result, CategoryNames)
+        _WriteDiskCache({BookId: Result})
+    return Result
+
+def _FetchBooks(BookIds: List[int]) -> Dict[int, dict]:
+    """
+    Fetch many book rows with one IN (...) query per VIEW_BATCH_SIZE IDs
+    
+    Args:
+        BookIds: Book IDs to fetch
         
-        Result = Cursor.fetchone()
+    Returns:
+        Rows keyed by BookID; IDs that do not exist are absent
+    """
+    UniqueIds = list(dict.fromkeys(BookIds))
+    Books = _ReadDiskCache(UniqueIds)
+    MissingIds = [BookId for BookId in UniqueIds if BookId not in Books]
+    if not MissingIds:
+        return Books
+    
+    CategoryNames = _CategoryNames()
+    Fetched = {}
+    
+    with GetCursor(dictionary=True) as (Connection, Cursor):
+        for Start in range(0, len(MissingIds), VIEW_BATCH_SIZE):
+            Batch = MissingIds[Start:Start + VIEW_BATCH_SIZE]
+            Placeholders = ', '.join(['%s'] * len(Batch))
+            Cursor.execute(f"{BOOK_RECORD_SQL}    WHERE B.BookID IN ({Placeholders})\n", tuple(Batch))
+            for Result in Cursor.fetchall():
+                Fetched[Result['BookID']] = _ResolveCategory(Result, CategoryNames)
+    
+    _WriteDiskCache(Fetched)
+    Books.update(Fetched)
+    return Books
+
+def _RenderBook(Result: dict) -> None:
+    """
+    Print a book row in maintenance format
+    
+    Args:
+        Result: Book row (keyed by column name) from _FetchBook or _FetchBooks
+    """
+    # Merge defaults for empty fields in one pass so the format strings stay branch-free
+    Display = {**Result, **{Field: Default for Field, Default in BOOK_FIELD_DEFAULTS.items() if not Result.get(Field)}}
+    if Result.get('FileSizeMB'):
+        Display['FileSizeMB'] = f"{Result['FileSizeMB']:.2f}"
+    Display['HasThumbnail'] = 'Yes' if Result['HasThumbnail'] else 'No'
+    Display['HasCover'] = 'Yes' if Result['HasCover'] else 'No'
+    
+    # Display in TRUE maintenance format - Field Name: Value
+    # SPECIAL FOCUS: Subject, Category, Thumbnail
+    # Built as one block and written once rather than ~20 print() calls
+    Lines = [
+        "="*70,
+        f"📚 ANDERSON'S LIBRARY - BOOK RECORD #{Display['BookID']}",
+        "="*70,
+        "",
         
-        if not Result:
-            print(f"❌ Book with ID {BookId} not found")
-            return
+        # === SPECIAL INTEREST FIELDS FIRST ===
+        "🔍 CLASSIFICATION & ASSETS:",
+        f"Category: {Display['CategoryName']}",
+        f"Keywords: {Display['ExtractedKeywords']}",
+        f"Has Thumbnail: {Display['HasThumbnail']}",
+        f"Has Cover: {Display['HasCover']}",
+        "",
         
-        # Unpack results with enhanced fields
-        (BookID, FileName, Title, AuthorName, PublisherName, 
-         CategoryName, ExtractedKeywords, PublicationYear, PageCount, 
-         FileSizeMB, Language, PrimaryISBN, HasCover, HasThumbnail, AccessLevel) = Result
+        "📖 BIBLIOGRAPHIC DETAILS:",
+        f"Book ID: {Display['BookID']}",
+        f"Title: {Display['Title']}",
+        f"Author: {Display['AuthorName']}",
+        f"Publisher: {Display['PublisherName']}",
+        f"Publication Year: {Display['PublicationYear']}",
+        "",
         
-        # Display in TRUE maintenance format - Field Name: Value
-        # SPECIAL FOCUS: Subject, Category, Thumbnail
-        print("="*70)
-        print(f"📚 ANDERSON'S LIBRARY - BOOK RECORD #{BookID}")
-        print("="*70)
-        print()
+        "📁 FILE INFORMATION:",
+        f"File Name: {Display['FileName']}",
+        f"Page Count: {Display['PageCount']}",
+        f"File Size (MB): {Display['FileSizeMB']}",
+        f"Language: {Display['Language']}",
+        f"Primary ISBN: {Display['PrimaryISBN']}",
+        f"Access Level: {Display['AccessLevel']}",
         
-        # === SPECIAL INTEREST FIELDS FIRST ===
-        print("🔍 CLASSIFICATION & ASSETS:")
-        print(f"Category: {CategoryName or 'Uncategorized'}")
-        print(f"Keywords: {ExtractedKeywords or 'Not Specified'}")
-        print(f"Has Thumbnail: {'Yes' if HasThumbnail else 'No'}")
-        print(f"Has Cover: {'Yes' if HasCover else 'No'}")
-        print()
+        "",
+        "="*70,
+    ]
+    sys.stdout.write("\n".join(Lines) + "\n")
+
+def _JsonDefault(Value: Any) -> Any:
+    """Convert MySQL column types that the JSON encoders do not handle natively"""
+    if isinstance(Value, Decimal):
+        return float(Value)
+    if isinstance(Value, date):
+        return Value.isoformat()
+    raise TypeError(f"Cannot serialize {type(Value).__name__} to JSON")
+
+def _Notice(Message: str, AsJson: bool = False) -> None:
+    """Print a status or error line - to stderr in --json mode so stdout stays pure JSON lines"""
+    print(Message, file=sys.stderr if AsJson else sys.stdout)
+
+def _WriteJsonLines(Records: Iterable[dict]) -> None:
+    """
+    Write records to stdout as newline-delimited JSON, using orjson when it
+    is installed and the standard json module otherwise
+    
+    Args:
+        Records: Records to serialize, one per line
+    """
+    sys.stdout.flush()
+    Output = sys.stdout.buffer
+    for Record in Records:
+        if orjson is not None:
+            Output.write(orjson.dumps(Record, default=_JsonDefault) + b"\n")
+        else:
+            Output.write(json.dumps(Record, default=_JsonDefault, ensure_ascii=False).encode('utf-8') + b"\n")
+    Output.flush()
+
+def ViewBook(BookId: int, AsJson: bool = False) -> None:
+    """
+    Display a single book in maintenance format with special focus on
+    Keywords, Category, and Thumbnail information
+    
+    Args:
+        BookId: Book ID to display
+        AsJson: Emit the raw record as one JSON line instead
+    """
+    try:
+        Result = _FetchBook(BookId)
         
-        print("📖 BIBLIOGRAPHIC DETAILS:")
-        print(f"Book ID: {BookID}")
-        print(f"Title: {Title or 'Unknown'}")
-        print(f"Author: {AuthorName or 'Unknown'}")
-        print(f"Publisher: {PublisherName or 'Unknown'}")
-        print(f"Publication Year: {PublicationYear or 'Unknown'}")
-        print()
+        if not Result:
+            _Notice(f"❌ Book with ID {BookId} not found", AsJson)
+            return
         
-        print("📁 FILE INFORMATION:")
-        print(f"File Name: {FileName or 'Unknown'}")
-        print(f"Page Count: {PageCount or 'Unknown'}")
-        print(f"File Size (MB): {f'{FileSizeMB:.2f}' if FileSizeMB else 'Unknown'}")
-        print(f"Language: {Language or 'Unknown'}")
-        print(f"Primary ISBN: {PrimaryISBN or 'Not Available'}")
-        print(f"Access Level: {AccessLevel or 'Unknown'}")
+        if AsJson:
+            _WriteJsonLines([Result])
+        else:
+            _RenderBook(Result)
         
-        print()
-        print("="*70)
+    except Exception as ViewError:
+        _Notice(f"❌ Error viewing book: {ViewError}", AsJson)
+
+def ViewBooks(BookIds: List[int], AsJson: bool = False) -> None:
+    """
+    Display several books in maintenance format, fetched in batched queries
+    and shown in the order requested
+    
+    Args:
+        BookIds: Book IDs to display
+        AsJson: Emit the raw records as JSON lines instead
+    """
+    try:
+        Books = _FetchBooks(BookIds)
         
-        Cursor.close()
-        Connection.close()
+        for BookId in BookIds:
+            Result = Books.get(BookId)
+            if not Result:
+                _Notice(f"❌ Book with ID {BookId} not found", AsJson)
+                continue
+            if AsJson:
+                _WriteJsonLines([Result])
+            else:
+                _RenderBook(Result)
         
     except Exception as ViewError:
-        print(f"❌ Error viewing book: {ViewError}")
+        _Notice(f"❌ Error viewing books: {ViewError}", AsJson)
 
-def ListBooks() -> None:
-    """List available books with category and thumbnail information"""
+def ListBooks(AsJson: bool = False) -> None:
+    """
+    List available books with category and thumbnail information
+    
+    Args:
+        AsJson: Emit one JSON line per book instead of the table
+    """
     try:
-        Connection = mysql.connector.connect(**MYSQL_CONFIG)
-        Cursor = Connection.cursor()
-        
-        # Enhanced query to show category and thumbnail in listing
-        Cursor.execute("""
-            SELECT BookID, Title, AuthorName, CategoryName, HasThumbnail
-            FROM Books B
-            LEFT JOIN Authors A ON B.AuthorID = A.AuthorID
-            LEFT JOIN Categories C ON B.CategoryID = C.CategoryID
-            ORDER BY BookID 
-            LIMIT 60
-        """)
+        if AsJson:
+            CategoryNames = _CategoryNames()
+            _WriteJsonLines(
+                {'BookID': BookID, 'TitleShort': TitleShort, 'AuthorShort': AuthorShort,
+                 'CategoryName': CategoryNames.get(CategoryID), 'HasThumbnail': bool(HasThumbnail)}
+                for BookID, TitleShort, AuthorShort, CategoryID, HasThumbnail in _IterCachedRows('list', LIST_BOOKS_SQL)
+            )
+            return
         
-        print("📚 Available Books with Category & Thumbnail Info:")
-        print("-" * 75)
-        print("ID   | Title                          | Author         | Category      | Thumb")
-        print("-" * 75)
+        Lines = [
+            "📚 Available Books with Category & Thumbnail Info:",
+            "-" * 75,
+            "ID   | Title                          | Author         | Category      | Thumb",
+            "-" * 75,
+        ]
         
-        for BookID, Title, AuthorName, CategoryName, HasThumbnail in Cursor.fetchall():
-            TitleShort = (Title[:28] + "..") if Title and len(Title) > 28 else (Title or "Unknown")
-            AuthorShort = (AuthorName[:12] + "..") if AuthorName and len(AuthorName) > 12 else (AuthorName or "Unknown")
-            CategoryShort = (CategoryName[:12] + "..") if CategoryName and len(CategoryName) > 12 else (CategoryName or "None")
+        # Title/Author arrive pre-truncated from SQL; category names are shortened once per category
+        CategoryShortNames = {
+            CategoryID: (CategoryName[:12] + "..") if CategoryName and len(CategoryName) > 12 else CategoryName
+            for CategoryID, CategoryName in _CategoryNames().items()
+        }
+        for BookID, TitleShort, AuthorShort, CategoryID, HasThumbnail in _IterCachedRows('list', LIST_BOOKS_SQL):
+            CategoryShort = CategoryShortNames.get(CategoryID) or "None"
             ThumbStatus = "✓" if HasThumbnail else "✗"
             
-            print(f"{BookID:4d} | {TitleShort:<30} | {AuthorShort:<14} | {CategoryShort:<13} | {ThumbStatus}")
-        
-        print("-" * 75)
-        print("💡 Usage: python BookViewer.py <BookID> (focus on Category, Keywords, Thumbnail)")
-        print("📁 ✓ = Has Thumbnail, ✗ = No Thumbnail")
+            Lines.append(f"{BookID:4d} | {TitleShort or 'Unknown':<30} | {AuthorShort or 'Unknown':<14} | {CategoryShort:<13} | {ThumbStatus}")
+            if len(Lines) >= OUTPUT_CHUNK_LINES:
+                sys.stdout.write("\n".join(Lines) + "\n")
+                Lines.clear()
         
-        Cursor.close()
-        Connection.close()
+        Lines += [
+            "-" * 75,
+            "💡 Usage: python BookViewer.py <BookID> (focus on Category, Keywords, Thumbnail)",
+            "📁 ✓ = Has Thumbnail, ✗ = No Thumbnail",
+        ]
+        sys.stdout.write("\n".join(Lines) + "\n")
         
     except Exception as ListError:
-        print(f"❌ Error listing books: {ListError}")
+        _Notice(f"❌ Error listing books: {ListError}", AsJson)
 
-def SearchByCategory() -> None:
-    """Show books grouped by category"""
+def SearchByCategory(AsJson: bool = False) -> None:
+    """
+    Show books grouped by category
+    
+    Args:
+        AsJson: Emit one JSON line per category instead
+    """
     try:
-        Connection = mysql.connector.connect(**MYSQL_CONFIG)
-        Cursor = Connection.cursor()
-        
-        Cursor.execute("""
-            SELECT 
-                COALESCE(C.CategoryName, 'Uncategorized') AS Category,
-                COUNT(*) AS BookCount,
-                GROUP_CONCAT(CONCAT(B.BookID, ':', LEFT(B.Title, 30)) SEPARATOR ' | ') AS BookSample
-            FROM Books B
-            LEFT JOIN Categories C ON B.CategoryID = C.CategoryID
-            GROUP BY C.CategoryName
-            ORDER BY BookCount DESC
-        """)
+        if not AsJson:
+            print("📂 BOOKS BY CATEGORY:")
+            print("=" * 80)
         
-        print("📂 BOOKS BY CATEGORY:")
-        print("=" * 80)
-        
-        for Category, BookCount, BookSample in Cursor.fetchall():
+        CategoryNames = _CategoryNames()
+        for (CategoryID, BookCount), Samples in itertools.groupby(_IterCachedRows('categories', CATEGORY_SUMMARY_SQL), key=lambda Row: Row[:2]):
+            Category = CategoryNames.get(CategoryID) or 'Uncategorized'
+            if AsJson:
+                _WriteJsonLines([{
+                    'CategoryName': Category,
+                    'BookCount': BookCount,
+                    'Samples': [{'BookID': BookId, 'Title': BookTitle} for _, _, BookId, BookTitle in Samples],
+                }])
+                continue
             print(f"\n📁 {Category} ({BookCount} books)")
-            if BookSample:
-                Samples = BookSample.split(' | ')[:3]  # Show first 3 books
-                for Sample in Samples:
-                    if ':' in Sample:
-                        BookId, BookTitle = Sample.split(':', 1)
-                        print(f"   • ID {BookId}: {BookTitle}")
-        
-        Cursor.close()
-        Connection.close()
+            for _, _, BookId, BookTitle in Samples:
+                print(f"   • ID {BookId}: {BookTitle}")
         
     except Exception as SearchError:
-        print(f"❌ Error searching categories: {SearchError}")
+        _Notice(f"❌ Error searching categories: {SearchError}", AsJson)
 
-def SearchThumbnails() -> None:
-    """Show books with/without thumbnails"""
+def SearchThumbnails(AsJson: bool = False) -> None:
+    """
+    Show books with/without thumbnails
+    
+    Args:
+        AsJson: Emit the summary as a single JSON line instead
+    """
     try:
-        Connection = mysql.connector.connect(**MYSQL_CONFIG)
-        Cursor = Connection.cursor()
+        # Count books with and without thumbnails in one pass
+        with GetPreparedCursor(THUMBNAIL_COUNTS_SQL) as Cursor:
+            Cursor.execute(THUMBNAIL_COUNTS_SQL)
+            ThumbnailCounts = dict(Cursor.fetchall())
+        WithThumbs = ThumbnailCounts.get(1, 0)
+        WithoutThumbs = ThumbnailCounts.get(0, 0)
         
-        print("🖼️ THUMBNAIL STATUS SUMMARY:")
-        print("=" * 50)
-        
-        # Count books with thumbnails
-        Cursor.execute("SELECT COUNT(*) FROM Books WHERE HasThumbnail = 1")
-        WithThumbs = Cursor.fetchone()[0]
+        # Show some books with thumbnails
+        with GetPreparedCursor(THUMBNAIL_SAMPLE_SQL) as Cursor:
+            Cursor.execute(THUMBNAIL_SAMPLE_SQL, (1, THUMBNAIL_SAMPLE_SIZE))
+            SampleBooks = Cursor.fetchall()
         
-        Cursor.execute("SELECT COUNT(*) FROM Books WHERE HasThumbnail = 0")
-        WithoutThumbs = Cursor.fetchone()[0]
+        if AsJson:
+            _WriteJsonLines([{
+                'WithThumbnail': WithThumbs,
+                'WithoutThumbnail': WithoutThumbs,
+                'Samples': [{'BookID': BookID, 'TitleShort': TitleShort} for BookID, TitleShort in SampleBooks],
+            }])
+            return
         
+        print("🖼️ THUMBNAIL STATUS SUMMARY:")
+        print("=" * 50)
         print(f"✅ Books WITH thumbnails: {WithThumbs}")
         print(f"❌ Books WITHOUT thumbnails: {WithoutThumbs}")
         print()
         
-        # Show some books with thumbnails
-        Cursor.execute("""
-            SELECT BookID, Title 
-            FROM Books 
-            WHERE HasThumbnail = 1 
-            ORDER BY BookID 
-            LIMIT 10
-        """)
-        
         print("📋 Sample books WITH thumbnails:")
-        for BookID, Title in Cursor.fetchall():
-            TitleShort = (Title[:50] + "...") if Title and len(Title) > 50 else (Title or "Unknown")
-            print(f"   ID {BookID}: {TitleShort}")
-        
-        Cursor.close()
-        Connection.close()
-        
+        for BookID, TitleShort in SampleBooks:
+            print(f"   ID {BookID}: {TitleShort or 'Unknown'}")
+    
     except Exception as ThumbError:
-        print(f"❌ Error checking thumbnails: {ThumbError}")
+        _Notice(f"❌ Error checking thumbnails: {ThumbError}", AsJson)
+
+def PrintUsage(AsJson: bool = False) -> None:
+    """Print command-line usage; never touches the database"""
+    _Notice("\n".join([
+        "Usage: python BookViewer.py [--no-cache] [--json] <BookID> [<BookID> ...]",
+        "   or: python BookViewer.py [--json] list",
+        "   or: python BookViewer.py [--json] categories",
+        "   or: python BookViewer.py [--json] thumbnails",
+        "   or: python BookViewer.py help",
+        "",
+        "💡 Run 'python BookViewer.py list' to see available Book IDs",
+    ]), AsJson)
 
 def Main() -> None:
     """Main function with enhanced category/subject/thumbnail focus"""
-    print("🏔️ PROJECT HIMALAYA - BOOK VIEWER")
-    print("Special Focus: Category, Keywords, Thumbnail Analysis")
-    print("="*50)
-    
-    if len(sys.argv) == 1:
-        print("Usage: python BookViewer.py <BookID>")
-        print("   or: python BookViewer.py list")
-        print("   or: python BookViewer.py categories")
-        print("   or: python BookViewer.py thumbnails")
-        print()
-        ListBooks()
+    global _UseDiskCache
+    
+    Args = sys.argv[1:]
+    if '--no-cache' in Args:
+        Args = [Arg for Arg in Args if Arg != '--no-cache']
+        _UseDiskCache = False
+    
+    AsJson = '--json' in Args
+    if AsJson:
+        Args = [Arg for Arg in Args if Arg != '--json']
+    
+    # Machine consumers get bare JSON lines, no banner
+    if not AsJson:
+        print("🏔️ PROJECT HIMALAYA - BOOK VIEWER")
+        print("Special Focus: Category, Keywords, Thumbnail Analysis")
+        print("="*50)
+    
+    # Usage and bad arguments are answered before any connection is opened
+    if not Args:
+        PrintUsage(AsJson)
         return
     
-    Command = sys.argv[1].lower()
+    Command = Args[0].lower()
     
-    if Command == 'list':
-        ListBooks()
-    elif Command == 'categories':
-        SearchByCategory()
-    elif Command == 'thumbnails':
-        SearchThumbnails()
-    else:
+    if Command == 'help':
+        PrintUsage(AsJson)
+        return
+    
+    BookIds = []
+    if Command not in ('list', 'categories', 'thumbnails'):
         try:
-            BookId = int(sys.argv[1])
-            ViewBook(BookId)
+            BookIds = [int(Arg) for Arg in Args]
         except ValueError:
-            print("❌ Please provide a valid book ID or command")
-            print("📋 Commands: list, categories, thumbnails")
-            print("🔍 Focus: Category, Keywords, Thumbnail analysis")
-            ListBooks()
+            _Notice("❌ Please provide a valid book ID or command\n"
+                    "📋 Commands: list, categories, thumbnails, help\n"
+                    "🔍 Focus: Category, Keywords, Thumbnail analysis", AsJson)
+            return
+    
+    # One pooled connection serves the whole dispatch
+    with SharedConnection():
+        if Command == 'list':
+            ListBooks(AsJson)
+        elif Command == 'categories':
+            SearchByCategory(AsJson)
+        elif Command == 'thumbnails':
+            SearchThumbnails(AsJson)
+        elif len(BookIds) == 1:
+            ViewBook(BookIds[0], AsJson)
+        else:
+            ViewBooks(BookIds, AsJson)
 
 if __name__ == "__main__":
     Main()
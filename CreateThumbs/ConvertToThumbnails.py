@@ -10,17 +10,26 @@ Description: Convert PNG book covers to web-optimized thumbnails for Anderson's
 
 import os
 import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from PIL import Image
 import time
 from datetime import datetime
 
+try:
+    import pyvips
+except (ImportError, OSError):  # OSError: binding present but libvips missing
+    pyvips = None
+
 # Configuration
 SOURCE_DIR = "/home/herb/Desktop/BowersWorld-com/Covers"
 OUTPUT_DIR = "/home/herb/Desktop/BowersWorld-com/Thumbs"
 THUMBNAIL_SIZE = (64, 85)  # Width x Height - optimized for book covers
-QUALITY_SETTING = 85  # PNG optimization level
+PNG_COMPRESS_LEVEL = 6  # zlib level; optimize=True tried several strategies per file for a few bytes
 PROGRESS_INTERVAL = 25  # Show progress every N files
+MAX_WORKERS = os.cpu_count() or 1  # Parallel conversion processes
+WORKER_CHUNK_SIZE = 32  # Images handed to a worker per dispatch
 
 def CreateOutputDirectory(OutputPath):
     """
@@ -40,6 +49,21 @@ def CreateOutputDirectory(OutputPath):
         print(f"❌ Failed to create output directory: {CreateError}")
         return False
 
+def ListPngEntries(DirectoryPath):
+    """
+    List PNG files in a directory with a single scandir pass
+    
+    Args:
+        DirectoryPath: Directory to list
+        
+    Returns:
+        list: os.DirEntry objects (stat() is cached per entry), matching
+        glob("*.png") - hidden files excluded
+    """
+    with os.scandir(DirectoryPath) as Entries:
+        return [Entry for Entry in Entries
+                if Entry.name.endswith('.png') and not Entry.name.startswith('.')]
+
 def ValidateSourceDirectory(SourcePath):
     """
     Validate that source directory exists and contains PNG files
@@ -54,8 +78,7 @@ def ValidateSourceDirectory(SourcePath):
         print(f"❌ Source directory not found: {SourcePath}")
         return False, 0
     
-    PngFiles = list(Path(SourcePath).glob("*.png"))
-    PngCount = len(PngFiles)
+    PngCount = len(ListPngEntries(SourcePath))
     
     if PngCount == 0:
         print(f"⚠️ No PNG files found in: {SourcePath}")
@@ -64,7 +87,7 @@ def ValidateSourceDirectory(SourcePath):
     print(f"📁 Found {PngCount} PNG files in source directory")
     return True, PngCount
 
-def ConvertSingleImage(SourcePath, OutputPath, ThumbnailSize):
+def ConvertSingleImage(SourcePath, OutputPath, ThumbnailSize, OriginalBytes=None):
     """
     Convert a single PNG file to thumbnail
     
@@ -72,43 +95,101 @@ def ConvertSingleImage(SourcePath, OutputPath, ThumbnailSize):
         SourcePath: Path to source PNG file
         OutputPath: Path for output thumbnail
         ThumbnailSize: Tuple of (width, height)
+        OriginalBytes: Source file size if the caller already has it (skips a stat)
         
     Returns:
         tuple: (bool: success, int: original_size, int: thumbnail_size)
     """
     try:
         # Get original file size
-        OriginalSize = os.path.getsize(SourcePath)
+        if OriginalBytes is None:
+            OriginalBytes = os.stat(SourcePath).st_size
         
-        # Open and process image
-        with Image.open(SourcePath) as OriginalImage:
-            # Convert RGBA to RGB if necessary (remove transparency)
-            if OriginalImage.mode in ('RGBA', 'LA'):
-                # Create white background
-                RgbImage = Image.new('RGB', OriginalImage.size, (255, 255, 255))
-                if OriginalImage.mode == 'RGBA':
-                    RgbImage.paste(OriginalImage, mask=OriginalImage.split()[-1])
-                else:
-                    RgbImage.paste(OriginalImage, mask=OriginalImage.split()[-1])
-                ProcessedImage = RgbImage
-            else:
-                ProcessedImage = OriginalImage.copy()
-            
-            # Create thumbnail while maintaining aspect ratio
-            ProcessedImage.thumbnail(ThumbnailSize, Image.Resampling.LANCZOS)
-            
-            # Save optimized thumbnail
-            ProcessedImage.save(OutputPath, 'PNG', optimize=True, quality=QUALITY_SETTING)
+        if pyvips is not None:
+            _ConvertWithVips(SourcePath, OutputPath, ThumbnailSize)
+        else:
+            _ConvertWithPil(SourcePath, OutputPath, ThumbnailSize)
         
         # Get thumbnail file size
-        ThumbnailSize = os.path.getsize(OutputPath)
+        OutputBytes = os.stat(OutputPath).st_size
         
-        return True, OriginalSize, ThumbnailSize
+        return True, OriginalBytes, OutputBytes
         
     except Exception as ConversionError:
         print(f"❌ Error converting {SourcePath}: {ConversionError}")
         return False, 0, 0
 
+def _ConvertWithVips(SourcePath, OutputPath, ThumbnailSize):
+    """
+    Thumbnail via libvips: shrink-on-load and a streamed pipeline, so the
+    full-size cover is never decoded into memory
+    
+    Args:
+        SourcePath: Path to source PNG file
+        OutputPath: Path for output thumbnail
+        ThumbnailSize: Tuple of (width, height)
+    """
+    Width, Height = ThumbnailSize
+    Thumbnail = pyvips.Image.thumbnail(str(SourcePath), Width, height=Height, size='down')
+    
+    # Remove transparency against a white background
+    if Thumbnail.hasalpha():
+        Thumbnail = Thumbnail.flatten(background=[255, 255, 255])
+    
+    Thumbnail.write_to_file(f"{OutputPath}[compression=9,strip]")
+
+def _ConvertWithPil(SourcePath, OutputPath, ThumbnailSize):
+    """
+    Thumbnail via PIL, used when pyvips/libvips is not installed
+    
+    Args:
+        SourcePath: Path to source PNG file
+        OutputPath: Path for output thumbnail
+        ThumbnailSize: Tuple of (width, height)
+    """
+    # Open and process image
+    with Image.open(SourcePath) as OriginalImage:
+        # Shrink first, maintaining aspect ratio: thumbnail() drafts/reduces on
+        # load where the format allows, and everything after runs on 64x85 pixels
+        # (RGBA is resampled premultiplied, so compositing afterwards is exact)
+        OriginalImage.thumbnail(ThumbnailSize, Image.Resampling.LANCZOS)
+        
+        # Convert RGBA to RGB if necessary (remove transparency)
+        if OriginalImage.mode in ('RGBA', 'LA'):
+            # Blend onto white in a single pass (no per-band split)
+            Background = Image.new('RGBA', OriginalImage.size, (255, 255, 255, 255))
+            ProcessedImage = Image.alpha_composite(Background, OriginalImage.convert('RGBA')).convert('RGB')
+        else:
+            ProcessedImage = OriginalImage
+        
+        # Save thumbnail (PNG ignores quality)
+        ProcessedImage.save(OutputPath, 'PNG', compress_level=PNG_COMPRESS_LEVEL)
+
+def ConvertSingleImageWorker(Task):
+    """
+    Process-pool entry point for ConvertSingleImage
+    
+    Args:
+        Task: (source_path, output_path, original_bytes) tuple
+        
+    Returns:
+        tuple: (bool: success, int: original_size, int: thumbnail_size)
+    """
+    SourcePath, OutputPath, OriginalBytes = Task
+    return ConvertSingleImage(SourcePath, OutputPath, THUMBNAIL_SIZE, OriginalBytes)
+
+def GetWorkerContext():
+    """
+    Pick the multiprocessing start method for conversion workers
+    
+    Returns:
+        Context: forkserver where available (workers start from a clean, already
+        imported server process), otherwise the platform default
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context()
+
 def FormatFileSize(SizeInBytes):
     """
     Format file size in human-readable format
@@ -157,41 +238,47 @@ def GenerateThumbnails():
     TotalThumbnailSize = 0
     SkippedCount = 0
     
-    PngFiles = list(Path(SOURCE_DIR).glob("*.png"))
+    PngEntries = ListPngEntries(SOURCE_DIR)
+    ExistingThumbnails = {Entry.name for Entry in ListPngEntries(OUTPUT_DIR)}
     
-    print(f"🔄 Starting conversion of {len(PngFiles)} files...")
-    print()
-    
-    for FileIndex, SourceFile in enumerate(PngFiles, 1):
-        FileName = SourceFile.name
-        OutputFile = Path(OUTPUT_DIR) / FileName
+    # Skip existing thumbnails up front so every dispatched task does real work
+    PendingFiles = []
+    for SourceEntry in PngEntries:
+        FileName = SourceEntry.name
         
         # Check if thumbnail already exists
-        if OutputFile.exists():
+        if FileName in ExistingThumbnails:
             print(f"⏭️ Skipping {FileName} (already exists)")
             SkippedCount += 1
             continue
         
-        # Convert image
-        Success, OriginalSize, ThumbnailSize = ConvertSingleImage(
-            str(SourceFile), str(OutputFile), THUMBNAIL_SIZE
-        )
+        PendingFiles.append((SourceEntry.path, os.path.join(OUTPUT_DIR, FileName), SourceEntry.stat().st_size))
+    
+    print(f"🔄 Starting conversion of {len(PendingFiles)} files using {MAX_WORKERS} workers...")
+    print()
+    
+    # Convert images in parallel; results arrive in submission order
+    with ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=GetWorkerContext()) as Executor:
+        Results = Executor.map(ConvertSingleImageWorker, PendingFiles, chunksize=WORKER_CHUNK_SIZE)
         
-        if Success:
-            ProcessedCount += 1
-            TotalOriginalSize += OriginalSize
-            TotalThumbnailSize += ThumbnailSize
+        for FileIndex, ((SourcePath, _, _), (Success, OriginalBytes, ThumbnailBytes)) in enumerate(zip(PendingFiles, Results), 1):
+            FileName = os.path.basename(SourcePath)
             
-            # Calculate compression ratio
-            CompressionRatio = (1 - (ThumbnailSize / OriginalSize)) * 100 if OriginalSize > 0 else 0
-            
-            # Show progress
-            if ProcessedCount % PROGRESS_INTERVAL == 0 or FileIndex == len(PngFiles):
-                print(f"📸 Processed {ProcessedCount}/{TotalFiles}: {FileName}")
-                print(f"   📊 {FormatFileSize(OriginalSize)} → {FormatFileSize(ThumbnailSize)} ({CompressionRatio:.1f}% reduction)")
+            if Success:
+                ProcessedCount += 1
+                TotalOriginalSize += OriginalBytes
+                TotalThumbnailSize += ThumbnailBytes
                 
-        else:
-            ErrorCount += 1
+                # Calculate compression ratio
+                CompressionRatio = (1 - (ThumbnailBytes / OriginalBytes)) * 100 if OriginalBytes > 0 else 0
+                
+                # Show progress
+                if ProcessedCount % PROGRESS_INTERVAL == 0 or FileIndex == len(PendingFiles):
+                    print(f"📸 Processed {ProcessedCount}/{TotalFiles}: {FileName}")
+                    print(f"   📊 {FormatFileSize(OriginalBytes)} → {FormatFileSize(ThumbnailBytes)} ({CompressionRatio:.1f}% reduction)")
+                    
+            else:
+                ErrorCount += 1
     
     # Calculate final statistics
     EndTime = time.time()
@@ -265,6 +352,10 @@ def ValidateEnvironment():
     try:
         import PIL
         print(f"✅ PIL/Pillow version: {PIL.__version__}")
+        if pyvips is not None:
+            print(f"✅ libvips version: {pyvips.version(0)}.{pyvips.version(1)}.{pyvips.version(2)}")
+        else:
+            print("ℹ️ pyvips not found - using PIL for conversion (pip install pyvips)")
         return True
     except ImportError:
         print("❌ PIL/Pillow not found!")
@@ -4,8 +4,13 @@ Fix Problematic PNG Files - Simple metadata stripping approach
 """
 
 import os
+import warnings
 from PIL import Image
-import io
+
+try:
+    import pyvips
+except (ImportError, OSError):  # OSError: binding present but libvips missing
+    pyvips = None
 
 # The problematic files
 PROBLEMATIC_FILES = [
@@ -16,6 +21,49 @@ PROBLEMATIC_FILES = [
 OUTPUT_DIR = "/home/herb/Desktop/BowersWorld-com/Thumbs"
 THUMBNAIL_SIZE = (64, 85)
 
+def convert_with_pil(source_path, output_path):
+    """
+    Load with PIL (warnings ignored), flatten to clean RGB and save the thumbnail
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        img = Image.open(source_path)
+        img.load()  # Force load the image data
+    
+    # Convert to clean RGB format (strips all metadata)
+    if img.mode in ('RGBA', 'LA', 'P'):
+        # Blend onto a white background in a single pass (no per-band split)
+        background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+        clean_img = Image.alpha_composite(background, img.convert('RGBA')).convert('RGB')
+    else:
+        # Convert to RGB to strip metadata
+        clean_img = img.convert('RGB')
+    
+    # Create thumbnail
+    clean_img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+    
+    # Save as clean PNG (no metadata)
+    clean_img.save(output_path, 'PNG', optimize=True)
+    
+    # Clean up
+    img.close()
+    clean_img.close()
+
+def convert_with_vips(source_path, output_path):
+    """
+    Thumbnail straight from the file with libvips, which tolerates broken
+    metadata chunks that PIL rejects
+    """
+    img = pyvips.Image.new_from_file(source_path, fail_on='none')
+    thumb = img.thumbnail_image(THUMBNAIL_SIZE[0], height=THUMBNAIL_SIZE[1], size='down')
+    
+    # Remove transparency against a white background
+    if thumb.hasalpha():
+        thumb = thumb.flatten(background=[255, 255, 255])
+    
+    # Save as clean PNG (no metadata)
+    thumb.write_to_file(output_path + '[strip]')
+
 def fix_and_convert_png(source_path, output_path):
     """
     Fix PNG by completely stripping metadata and converting to thumbnail
@@ -23,46 +71,16 @@ def fix_and_convert_png(source_path, output_path):
     try:
         print(f"🔧 Fixing: {os.path.basename(source_path)}")
         
-        # Method 1: Try loading with warnings ignored
+        # Method 1: PIL with warnings ignored
         try:
-            import warnings
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                img = Image.open(source_path)
-                img.load()  # Force load the image data
+            convert_with_pil(source_path, output_path)
         except Exception:
-            # Method 2: Load as raw pixel data and rebuild
-            print(f"   🔄 Trying alternative loading method...")
-            with open(source_path, 'rb') as f:
-                # Read file as bytes
-                img_bytes = f.read()
+            if pyvips is None:
+                raise
             
-            # Load into PIL and immediately convert to clean format
-            img_stream = io.BytesIO(img_bytes)
-            img = Image.open(img_stream)
-            img.load()
-        
-        # Convert to clean RGB format (strips all metadata)
-        if img.mode in ('RGBA', 'LA', 'P'):
-            # Create white background
-            clean_img = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            if img.mode in ('RGBA', 'LA'):
-                clean_img.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-        else:
-            # Convert to RGB to strip metadata
-            clean_img = img.convert('RGB')
-        
-        # Create thumbnail
-        clean_img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-        
-        # Save as clean PNG (no metadata)
-        clean_img.save(output_path, 'PNG', optimize=True)
-        
-        # Clean up
-        img.close()
-        clean_img.close()
+            # Method 2: libvips reads the file directly - no second in-memory copy
+            print(f"   🔄 Trying libvips loader...")
+            convert_with_vips(source_path, output_path)
         
         # Check result
         if os.path.exists(output_path):
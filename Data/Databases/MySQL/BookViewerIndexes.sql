@@ -0,0 +1,45 @@
+-- File: BookViewerIndexes.sql
+-- Path: Data/Databases/MySQL/BookViewerIndexes.sql
+-- Standard: AIDEV-PascalCase-1.8
+-- Created: 2026-10-15
+-- Last Modified: 2026-10-15  11:30AM
+-- Description: Ensure the Books indexes that BookViewer.py relies on exist
+-- Author: Herb Bowers - Project Himalaya
+
+-- Safe to re-run: each index is only created when it is missing.
+--   idx_books_thumbnail - thumbnail counts (GROUP BY HasThumbnail) and samples
+--   idx_books_category  - category summary (PARTITION BY CategoryID)
+
+USE MyLibraryMaster;
+
+-- Books(HasThumbnail)
+SET @IndexExists = (
+    SELECT COUNT(*) FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE()
+      AND TABLE_NAME = 'Books'
+      AND INDEX_NAME = 'idx_books_thumbnail'
+);
+SET @Sql = IF(@IndexExists = 0,
+    'CREATE INDEX idx_books_thumbnail ON Books (HasThumbnail)',
+    'SELECT ''idx_books_thumbnail already exists'' AS Status');
+PREPARE Stmt FROM @Sql;
+EXECUTE Stmt;
+DEALLOCATE PREPARE Stmt;
+
+-- Books(CategoryID)
+SET @IndexExists = (
+    SELECT COUNT(*) FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE()
+      AND TABLE_NAME = 'Books'
+      AND INDEX_NAME = 'idx_books_category'
+);
+SET @Sql = IF(@IndexExists = 0,
+    'CREATE INDEX idx_books_category ON Books (CategoryID)',
+    'SELECT ''idx_books_category already exists'' AS Status');
+PREPARE Stmt FROM @Sql;
+EXECUTE Stmt;
+DEALLOCATE PREPARE Stmt;
+
+-- Verify: both should report the index under "key" (Using index for the count)
+EXPLAIN SELECT HasThumbnail, COUNT(*) FROM Books GROUP BY HasThumbnail;
+EXPLAIN SELECT BookID FROM Books WHERE CategoryID = 1 ORDER BY BookID;
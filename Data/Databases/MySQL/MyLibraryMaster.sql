@@ -171,6 +171,7 @@ CREATE TABLE Books (
     INDEX idx_books_downloads (DownloadCount),
     INDEX idx_books_access (AccessLevel),
     INDEX idx_books_active (IsActive),
+    INDEX idx_books_thumbnail (HasThumbnail),
     
     -- Search indexes
     INDEX idx_books_search_title (Title(100)),
@@ -13,6 +13,7 @@ Contact: HimalayaProject1@gmail.com
 """
 
 import mysql.connector
+from collections import Counter, defaultdict
 from pathlib import Path
 import os
 
@@ -26,14 +27,83 @@ MYSQL_CONFIG = {
     'charset': 'utf8mb4'
 }
 
-def DebugMissingThumbnails():
-    """Debug why some thumbnails appear missing"""
+def Trigrams(Text):
+    """Return the set of 3-character substrings of Text"""
+    return {Text[Index:Index + 3] for Index in range(len(Text) - 2)}
+
+def BuildTrigramIndex(ThumbStems):
+    """
+    Index lowercase thumbnail stems by trigram for similar-name lookups
+    
+    Args:
+        ThumbStems: List of (lowercase_stem, file_name) tuples
+        
+    Returns:
+        tuple: (dict: trigram -> set of positions in ThumbStems, list: trigram count per stem).
+        Stems too short to have a trigram are filed under the '' key.
+    """
+    TrigramIndex = defaultdict(set)
+    TrigramCounts = []
+    
+    for Position, (ThumbStem, _) in enumerate(ThumbStems):
+        StemTrigrams = Trigrams(ThumbStem)
+        for Trigram in StemTrigrams or {''}:
+            TrigramIndex[Trigram].add(Position)
+        TrigramCounts.append(len(StemTrigrams))
+    
+    return TrigramIndex, TrigramCounts
+
+def FindSimilarThumbnails(BaseName, ThumbStems, TrigramIndex, TrigramCounts):
+    """
+    Find thumbnails whose stem contains, or is contained in, BaseName (case-insensitive)
+    
+    A stem containing the query shares all of the query's trigrams; a stem
+    contained in the query has all of its own trigrams in the query. Only those
+    candidates get the real substring check instead of every thumbnail.
+    
+    Args:
+        BaseName: Book file stem to match
+        ThumbStems: List of (lowercase_stem, file_name) tuples
+        TrigramIndex, TrigramCounts: Output of BuildTrigramIndex(ThumbStems)
+        
+    Returns:
+        list: Matching thumbnail file names in directory-listing order
+    """
+    LowerBaseName = BaseName.lower()
+    QueryTrigrams = Trigrams(LowerBaseName)
+    
+    if not QueryTrigrams:
+        # Query too short to index - any stem may contain it
+        Candidates = range(len(ThumbStems))
+    else:
+        SharedCounts = Counter()
+        for Trigram in QueryTrigrams:
+            SharedCounts.update(TrigramIndex.get(Trigram, ()))
+        
+        Candidates = {Position for Position, Shared in SharedCounts.items()
+                      if Shared == len(QueryTrigrams) or Shared == TrigramCounts[Position]}
+        Candidates |= TrigramIndex.get('', set())
+    
+    SimilarFiles = []
+    for Position in sorted(Candidates):
+        ThumbStem, ThumbName = ThumbStems[Position]
+        if LowerBaseName in ThumbStem or ThumbStem in LowerBaseName:
+            SimilarFiles.append(ThumbName)
+    
+    return SimilarFiles
+
+def DebugMissingThumbnails(Connection):
+    """
+    Debug why some thumbnails appear missing
+    
+    Args:
+        Connection: Open MySQL connection shared by all checks
+    """
     print("🔍 DEBUGGING THUMBNAIL FILENAME MISMATCHES")
     print("="*60)
     
     try:
-        Connection = mysql.connector.connect(**MYSQL_CONFIG)
-        Cursor = Connection.cursor()
+        Cursor = Connection.cursor(buffered=True)
         
         # Get books without thumbnails
         Cursor.execute("""
@@ -47,30 +117,31 @@ def DebugMissingThumbnails():
         MissingBooks = Cursor.fetchall()
         ThumbDir = Path("Data/Thumbs")
         
+        # List the thumbnail directory once; lowercase stems for similarity checks
+        ThumbStems = [(ThumbFile.stem.lower(), ThumbFile.name) for ThumbFile in ThumbDir.glob("*.png")]
+        TrigramIndex, TrigramCounts = BuildTrigramIndex(ThumbStems)
+        ExistingThumbNames = {ThumbName for _, ThumbName in ThumbStems}
+        
         print(f"📋 Found {len(MissingBooks)} books marked as missing thumbnails")
         print()
         
         for BookID, FileName in MissingBooks:
             BaseName = Path(FileName).stem
             ExpectedThumb = ThumbDir / f"{BaseName}.png"
+            ThumbExists = ExpectedThumb.name in ExistingThumbNames
             
             print(f"📚 Book ID {BookID}:")
             print(f"   Database filename: {FileName}")
             print(f"   Base name: {BaseName}")
             print(f"   Expected thumbnail: {ExpectedThumb}")
-            print(f"   Thumbnail exists: {ExpectedThumb.exists()}")
+            print(f"   Thumbnail exists: {ThumbExists}")
             
-            if not ExpectedThumb.exists():
+            if not ThumbExists:
                 # Look for similar filenames
                 print(f"   🔍 Looking for similar thumbnails...")
                 
                 # Try different variations
-                SimilarFiles = []
-                
-                for ThumbFile in ThumbDir.glob("*.png"):
-                    ThumbStem = ThumbFile.stem
-                    if BaseName.lower() in ThumbStem.lower() or ThumbStem.lower() in BaseName.lower():
-                        SimilarFiles.append(ThumbFile.name)
+                SimilarFiles = FindSimilarThumbnails(BaseName, ThumbStems, TrigramIndex, TrigramCounts)
                 
                 if SimilarFiles:
                     print(f"   📁 Similar thumbnails found:")
@@ -82,19 +153,72 @@ def DebugMissingThumbnails():
             print()
         
         Cursor.close()
-        Connection.close()
         
     except Exception as DebugError:
         print(f"❌ Error debugging: {DebugError}")
 
-def CheckThumbnailCounts():
-    """Compare database vs filesystem thumbnail counts"""
+def AuditMissingThumbnailFiles(Connection):
+    """
+    Find every book with no thumbnail file, set-wise in MySQL
+    
+    Args:
+        Connection: Open MySQL connection shared by all checks
+    """
+    print("🗂️ FULL THUMBNAIL FILE AUDIT")
+    print("="*50)
+    
+    try:
+        Cursor = Connection.cursor(buffered=True)
+        
+        # Load the thumbnail directory listing into a session temp table;
+        # binary collation to match the case-sensitive filesystem
+        ThumbDir = Path("Data/Thumbs")
+        Cursor.execute("DROP TEMPORARY TABLE IF EXISTS ThumbnailFiles")
+        Cursor.execute("""
+            CREATE TEMPORARY TABLE ThumbnailFiles (
+                ThumbName VARCHAR(255) COLLATE utf8mb4_bin PRIMARY KEY
+            )
+        """)
+        Cursor.executemany(
+            "INSERT IGNORE INTO ThumbnailFiles (ThumbName) VALUES (%s)",
+            [(ThumbFile.name,) for ThumbFile in ThumbDir.glob("*.png")]
+        )
+        
+        # Same FileName -> thumbnail mapping as the BooksDisplay view
+        Cursor.execute("""
+            SELECT B.BookID, B.FileName, B.HasThumbnail
+            FROM Books B
+            LEFT JOIN ThumbnailFiles T
+                ON T.ThumbName = REPLACE(B.FileName, '.pdf', '.png') COLLATE utf8mb4_bin
+            WHERE T.ThumbName IS NULL
+            ORDER BY B.BookID
+        """)
+        MissingFiles = Cursor.fetchall()
+        FlaggedPresent = sum(1 for _, _, HasThumbnail in MissingFiles if HasThumbnail)
+        
+        print(f"📋 Books with no thumbnail file: {len(MissingFiles)}")
+        print(f"   ⚠️ Of those flagged HasThumbnail = 1: {FlaggedPresent}")
+        for BookID, FileName, _ in MissingFiles[:10]:
+            print(f"      • {BookID}: {FileName}")
+        
+        Cursor.execute("DROP TEMPORARY TABLE IF EXISTS ThumbnailFiles")
+        Cursor.close()
+        
+    except Exception as AuditError:
+        print(f"❌ Error auditing thumbnail files: {AuditError}")
+
+def CheckThumbnailCounts(Connection):
+    """
+    Compare database vs filesystem thumbnail counts
+    
+    Args:
+        Connection: Open MySQL connection shared by all checks
+    """
     print("📊 THUMBNAIL COUNT COMPARISON")
     print("="*50)
     
     try:
-        Connection = mysql.connector.connect(**MYSQL_CONFIG)
-        Cursor = Connection.cursor()
+        Cursor = Connection.cursor(buffered=True)
         
         # Database counts
         Cursor.execute("SELECT COUNT(*) FROM Books WHERE HasThumbnail = 1")
@@ -125,7 +249,6 @@ def CheckThumbnailCounts():
             print(f"   💡 Enough thumbnails exist - this is a filename matching issue")
         
         Cursor.close()
-        Connection.close()
         
     except Exception as CountError:
         print(f"❌ Error checking counts: {CountError}")
@@ -135,9 +258,21 @@ def Main():
     print("🏔️ PROJECT HIMALAYA - THUMBNAIL MISMATCH DEBUGGER")
     print("="*70)
     
-    CheckThumbnailCounts()
-    print()
-    DebugMissingThumbnails()
+    # One connection for every check instead of a handshake per function
+    try:
+        Connection = mysql.connector.connect(**MYSQL_CONFIG)
+    except Exception as ConnectError:
+        print(f"❌ Error connecting to MySQL: {ConnectError}")
+        return
+    
+    try:
+        CheckThumbnailCounts(Connection)
+        print()
+        DebugMissingThumbnails(Connection)
+        print()
+        AuditMissingThumbnailFiles(Connection)
+    finally:
+        Connection.close()
 
 if __name__ == "__main__":
     Main()
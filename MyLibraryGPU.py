@@ -23,26 +23,30 @@ Contact: HimalayaProject1@gmail.com
 """
 
 import os
+import sys
 import csv
 import sqlite3
 import time
 import signal
+import hashlib
 from pathlib import Path
-import PyPDF2
-import pandas as pd
 from datetime import datetime
 import re
 import fitz  # PyMuPDF
 import warnings
-import tempfile
 import threading
+import multiprocessing
+import contextlib
+import io
+from functools import partial
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, as_completed
 warnings.filterwarnings("ignore")
 
 # Core dependencies
 import numpy as np
 from PIL import Image
-from pdf2image import convert_from_path
-import pdfplumber
 
 # ===== TIMEOUT PROTECTION CLASSES =====
 
@@ -103,13 +107,60 @@ def TimeoutProtected(TimeoutSeconds):
 PDF_DIRECTORY = "/home/herb/Desktop/Not Backed Up/Anderson's Library/Andy/Anderson eBooks"
 DATABASE_PATH = "/home/herb/Desktop/BowersWorld-com/Assets/my_library.db"
 OUTPUT_CSV = "/home/herb/Desktop/BowersWorld-com/MyLibraryExtract.csv"
+OUTPUT_DATABASE = "/home/herb/Desktop/BowersWorld-com/MyLibraryExtract.db"  # queryable copy of the CSV rows
 PROGRESS_INTERVAL = 5
 
 # Himalaya text extraction limits
 MAX_TEXT_LENGTH = 20000
 MAX_PAGES_TO_PROCESS = 12
-OCR_DPI = 350
-GPU_BATCH_SIZE = 4
+SHARED_PDF_BUFFER_MB = 64  # PDFs up to this size are read once and shared by every parser
+SEARCH_TEXT_LENGTH = 25000  # chars of combined page text searched for identifiers
+ABSTRACT_PAGE_LIMIT = 5  # abstracts are only looked for on the first pages
+PAGE_STRIP_FRACTION = 0.4  # header/footer share of the page probed for front-matter markers
+FRONT_MATTER_MARKERS = ('title', 'copyright', '©', 'contents', 'chapter', 'index', 'abstract')
+OCR_DPI = 300  # re-render resolution for pages Tesseract is unsure about
+OCR_RENDER_DPI = 200  # PyMuPDF render resolution for OCR pages
+OCR_RETRY_CONFIDENCE = 60  # Tesseract mean word confidence below which a page is re-rendered
+EASYOCR_RETRY_CONFIDENCE = 0.5  # EasyOCR box confidence below which just that box is re-read at OCR_DPI
+EASYOCR_RETRY_MAX_BOXES = 64  # most low-confidence boxes re-read per page, least confident first
+OCR_PAGE_LIMIT = 4  # front pages rendered and OCR'd per PDF
+OCR_WORKERS = min(OCR_PAGE_LIMIT, os.cpu_count() or 1)  # Tesseract page processes
+BOOK_WORKERS = os.cpu_count() or 1  # whole-book extraction processes; with the GPU engine, OCR stays in the main process
+MAX_PENDING_BOOKS = BOOK_WORKERS * 4  # books submitted ahead of the writer; caps finished results held in memory
+MAX_PENDING_BOOKS_GPU = BOOK_WORKERS * 2  # tighter with the GPU engine - this process OCRs deferred books itself and drains slowly
+
+# OCR gate, measured on front-matter text right after PyMuPDF
+OCR_TEXT_THRESHOLD = 200  # chars - below this, the PDF is treated as scanned
+FONT_CHECK_PAGES = 3  # front pages checked for embedded fonts - any font means it is not a scan
+SCAN_IMAGE_COVERAGE = 0.8  # share of a page under image blocks that marks it a scan despite fonts
+EXTRACT_TABLES = True  # set False to never run the PyMuPDF table pass
+TABLE_PAGE_LIMIT = 4  # front pages searched for tables
+TABLE_MIN_DRAWINGS = 8  # vector paths a page needs before find_tables() is worth running
+GPU_BATCH_SIZE = 4  # EasyOCR recognizer batch (text crops per forward pass)
+EASYOCR_FP16 = True  # run EasyOCR models under fp16 autocast on tensor-core GPUs (compute capability 7+)
+
+# Himalaya enhanced CSV columns with new bibliographic fields
+CSV_COLUMNS = [
+    'filename', 'file_size_mb', 'page_count',
+    'database_category', 'database_subject',
+    'pdf_title', 'pdf_author', 'pdf_subject', 'pdf_creator', 'pdf_producer',
+    'pdf_creation_date', 'extracted_isbn', 'extracted_lccn', 'extracted_issn',
+    'extracted_oclc', 'extracted_year', 'extracted_publisher', 'extracted_edition', 
+    'extracted_doi', 'first_page_text', 'title_page_text', 'copyright_page_text',
+    'table_of_contents', 'full_text_sample', 'abstract_text', 'tables_content',
+    'extraction_method', 'ocr_used', 'enhanced_extraction',
+    'hardware_acceleration', 'gpu_accelerated', 'timeout_protection',
+    'extraction_quality_score', 'processing_time_seconds', 'errors'
+]
+CSV_BUFFER_SIZE = 1 << 20  # bytes buffered by the output handle between flushes
+
+# SQLite lookup settings
+SQLITE_CACHE_KB = 40000  # page cache for the database load
+SQLITE_MMAP_BYTES = 256 * 1024 * 1024  # memory-mapped read window
+SQLITE_FETCH_SIZE = 1000  # rows per fetchmany() batch
+OUTPUT_DB_BATCH_SIZE = 32  # rows per executemany() + commit into OUTPUT_DATABASE
+OUTPUT_DB_CACHE_KB = 20000  # page cache for the output database
+CONTENT_HASH_BYTES = 64 * 1024  # bytes hashed from each end of a PDF for its content key
 
 # Timeout settings
 PDF_OPEN_TIMEOUT = 15  # seconds to open PDF
@@ -117,6 +168,113 @@ PAGE_PROCESS_TIMEOUT = 10  # seconds per page
 OCR_TIMEOUT = 45  # seconds for OCR operation
 TOTAL_PDF_TIMEOUT = 120  # seconds for entire PDF processing
 
+# ===== EXTRACTION OUTPUT DATABASE =====
+
+class ExtractionDatabase:
+    """Batched WAL-mode SQLite table of extraction results, readable while a run is writing"""
+    
+    def __init__(self, DatabasePath, BatchSize=OUTPUT_DB_BATCH_SIZE):
+        self.DatabasePath = DatabasePath
+        self.BatchSize = BatchSize
+        self.Connection = None
+        self.PendingRows = []
+        self.PendingHashes = []
+        self.InsertSQL = (
+            f"INSERT OR REPLACE INTO enhanced_metadata ({', '.join(CSV_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(CSV_COLUMNS))})"
+        )
+        LookupFrom = (
+            f"FROM content_hashes h JOIN enhanced_metadata m ON m.{CSV_COLUMNS[0]} = h.{CSV_COLUMNS[0]} "
+            f"WHERE h.content_hash = ?"
+        )
+        self.LookupSQL = f"SELECT {', '.join('m.' + Column for Column in CSV_COLUMNS)} {LookupFrom}"
+        self.ExistsSQL = f"SELECT 1 {LookupFrom}"
+    
+    def __enter__(self):
+        try:
+            self.Connection = sqlite3.connect(self.DatabasePath)
+            self.Connection.executescript(f"""
+                PRAGMA journal_mode = WAL;
+                PRAGMA synchronous = NORMAL;
+                PRAGMA cache_size = -{OUTPUT_DB_CACHE_KB};
+                CREATE TABLE IF NOT EXISTS enhanced_metadata (
+                    {CSV_COLUMNS[0]} TEXT PRIMARY KEY,
+                    {', '.join(CSV_COLUMNS[1:])}
+                );
+                CREATE TABLE IF NOT EXISTS content_hashes (
+                    content_hash TEXT PRIMARY KEY,
+                    {CSV_COLUMNS[0]} TEXT
+                );
+            """)
+        except Exception as DbError:
+            print(f"⚠️ Output database unavailable ({DbError}) - writing CSV only")
+            self.Connection = None
+        return self
+    
+    def __exit__(self, ExcType, ExcVal, ExcTb):
+        self.Flush()
+        if self.Connection is not None:
+            self.Connection.close()
+            self.Connection = None
+    
+    def AddRow(self, BookData, ContentHash=None):
+        """Queue a record, keyed by ContentHash when given; rows are written in batches of BatchSize"""
+        if self.Connection is None:
+            return
+        
+        self.PendingRows.append(tuple(BookData.get(Column) for Column in CSV_COLUMNS))
+        if ContentHash:
+            self.PendingHashes.append((ContentHash, BookData[CSV_COLUMNS[0]]))
+        if len(self.PendingRows) >= self.BatchSize:
+            self.Flush()
+    
+    def Flush(self):
+        """Write and commit all queued records"""
+        if not self.PendingRows or self.Connection is None:
+            return
+        
+        try:
+            with self.Connection:
+                self.Connection.executemany(self.InsertSQL, self.PendingRows)
+                self.Connection.executemany(
+                    "INSERT OR IGNORE INTO content_hashes VALUES (?, ?)", self.PendingHashes)
+        except Exception as DbError:
+            print(f"❌ Error writing to output database: {DbError}")
+        finally:
+            self.PendingRows.clear()
+            self.PendingHashes.clear()
+    
+    def HasExtraction(self, ContentHash):
+        """True when a record is stored for the content key - without loading the record"""
+        if self.Connection is None or not ContentHash:
+            return False
+        
+        try:
+            return self.Connection.execute(self.ExistsSQL, (ContentHash,)).fetchone() is not None
+        except Exception as DbError:
+            print(f"⚠️ Content hash lookup failed: {DbError}")
+            return False
+    
+    def FindExtraction(self, ContentHash):
+        """
+        The stored record of an earlier book with the same content key
+        
+        Args:
+            ContentHash: Key from ContentHash()
+            
+        Returns:
+            dict: Record by CSV column, or None if the content is new
+        """
+        if self.Connection is None or not ContentHash:
+            return None
+        
+        try:
+            Row = self.Connection.execute(self.LookupSQL, (ContentHash,)).fetchone()
+        except Exception as DbError:
+            print(f"⚠️ Content hash lookup failed: {DbError}")
+            return None
+        return dict(zip(CSV_COLUMNS, Row)) if Row else None
+
 # ===== ENHANCED BIBLIOGRAPHIC EXTRACTION PATTERNS =====
 
 # Enhanced ISBN Patterns - Multiple formats and contexts
@@ -285,32 +443,351 @@ def ValidateISSN(ISSN: str) -> str:
     
     return ''
 
-def ExtractWithPatterns(Text: str, Patterns: list, Validator=None) -> str:
-    """Extract first valid match from multiple patterns with optional validation"""
-    for Pattern in Patterns:
-        Matches = Pattern.findall(Text)
-        for Match in Matches:
-            Extracted = Match if isinstance(Match, str) else Match[0] if Match else ''
-            if Extracted:
-                if Validator:
-                    Validated = Validator(Extracted)
-                    if Validated:
-                        return Validated
-                else:
-                    return Extracted.strip()
+def FirstValidMatch(Matches: list, Validator=None) -> str:
+    """Return the first valid match from a pre-scanned, priority-ordered match list"""
+    for Extracted in Matches:
+        if Extracted:
+            if Validator:
+                Validated = Validator(Extracted)
+                if Validated:
+                    return Validated
+            else:
+                return Extracted.strip()
     return ''
 
+class BibliographicScanner:
+    """
+    Scan text once for several priority-ordered pattern lists
+    
+    All patterns are folded into one lookahead alternation, so the text is walked
+    a single time instead of once per pattern. At each position where any pattern
+    can start, the remaining patterns are tried anchored there, so no match is lost
+    to an earlier alternative and results equal the per-pattern findall() loops.
+    """
+    
+    def __init__(self, PatternLists):
+        self.Patterns = [(Name, Index, Pattern)
+                         for Name, Patterns in PatternLists.items()
+                         for Index, Pattern in enumerate(Patterns)]
+        
+        Alternatives = []
+        self.AlternativeAt = {}  # outer group number -> position in self.Patterns
+        GroupNumber = 1
+        for Position, (_, _, Pattern) in enumerate(self.Patterns):
+            Flags = ('i' if Pattern.flags & re.IGNORECASE else '') + ('s' if Pattern.flags & re.DOTALL else '')
+            Alternatives.append(f'((?{Flags}:{Pattern.pattern}))')
+            self.AlternativeAt[GroupNumber] = Position
+            GroupNumber += 1 + Pattern.groups
+        
+        self.Combined = re.compile('(?=' + '|'.join(Alternatives) + ')')
+    
+    def Scan(self, Text: str) -> dict:
+        """Return {list name: matched values}, ordered by pattern priority then position"""
+        Hits = {}
+        NextStart = [0] * len(self.Patterns)  # findall() resumes after each match
+        for Match in self.Combined.finditer(Text):
+            Start = Match.start()
+            First = self.AlternativeAt[Match.lastindex]
+            for Position, (Name, Index, Pattern) in enumerate(self.Patterns[First:], First):
+                if Start < NextStart[Position]:
+                    continue
+                PatternMatch = Pattern.match(Text, Start)
+                if PatternMatch:
+                    NextStart[Position] = max(PatternMatch.end(), Start + 1)
+                    Hits.setdefault(Name, []).append((Index, Start, PatternMatch.group(1)))
+        
+        return {Name: [Value for _, _, Value in sorted(Found)] for Name, Found in Hits.items()}
+
+BIBLIOGRAPHIC_SCANNER = BibliographicScanner({
+    'ISBN': ISBN_PATTERNS,
+    'LCCN': LCCN_PATTERNS,
+    'ISSN': ISSN_PATTERNS,
+    'OCLC': OCLC_PATTERNS,
+    'DOI': DOI_PATTERNS,
+    'Year': YEAR_PATTERNS,
+    'Publisher': PUBLISHER_PATTERNS,
+    'Edition': EDITION_PATTERNS,
+})
+
+def ReadPDFBytes(PDFPath):
+    """Read a PDF in one sequential pass so every parser shares it; None if too large or unreadable"""
+    try:
+        with open(PDFPath, 'rb') as PDFHandle:
+            if os.fstat(PDFHandle.fileno()).st_size > SHARED_PDF_BUFFER_MB * 1024 * 1024:
+                return None
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(PDFHandle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            return PDFHandle.read()
+    except OSError:
+        return None
+
+def ContentHash(PDFPath, FileSize):
+    """
+    Cheap content key: blake2b of the size and the first and last CONTENT_HASH_BYTES
+    
+    Returns:
+        str: Hex digest, or None if the file cannot be read
+    """
+    Digest = hashlib.blake2b(str(FileSize).encode(), digest_size=16)
+    try:
+        with open(PDFPath, 'rb') as PDFHandle:
+            Digest.update(PDFHandle.read(CONTENT_HASH_BYTES))
+            if FileSize > CONTENT_HASH_BYTES:
+                PDFHandle.seek(max(CONTENT_HASH_BYTES, FileSize - CONTENT_HASH_BYTES))
+                Digest.update(PDFHandle.read())
+    except OSError:
+        return None
+    return Digest.hexdigest()
+
+def OpenPDF(PDFPath, PDFBytes=None):
+    """Open with PyMuPDF from the shared bytes when available, otherwise from disk"""
+    if PDFBytes is not None:
+        return fitz.open(stream=PDFBytes, filetype='pdf')
+    return fitz.open(str(PDFPath))
+
+def ExtractPageTables(Page, PageNum) -> list:
+    """Up to two ruled tables from a page as pipe-separated text, via PyMuPDF's find_tables()"""
+    # Line-strategy table detection needs vector rules; skip pages with too few paths
+    if len(Page.get_cdrawings()) < TABLE_MIN_DRAWINGS:
+        return []
+    
+    TablesContent = []
+    for TableNum, Table in enumerate(Page.find_tables().tables[:2]):
+        TableText = f"Table {TableNum + 1} (Page {PageNum + 1}):\n"
+        for Row in Table.extract()[:10]:
+            if Row:
+                TableText += " | ".join(str(Cell)[:50] if Cell else "" for Cell in Row) + "\n"
+        TablesContent.append(TableText)
+    
+    return TablesContent
+
+def JoinTextPrefix(Texts, Limit) -> str:
+    """Same as ' '.join(non-empty Texts)[:Limit], without joining the text past Limit"""
+    Pieces = []
+    JoinedLength = -1
+    for Text in Texts:
+        if Text:
+            Pieces.append(Text)
+            JoinedLength += len(Text) + 1
+            if JoinedLength >= Limit:
+                break
+    return ' '.join(Pieces)[:Limit]
+
+def ExtractPageStrips(Page) -> str:
+    """Text of the header and footer strips, where copyright, ISBN and heading lines sit"""
+    Rect = Page.rect
+    StripHeight = Rect.height * PAGE_STRIP_FRACTION
+    TopStrip = fitz.Rect(Rect.x0, Rect.y0, Rect.x1, Rect.y0 + StripHeight)
+    BottomStrip = fitz.Rect(Rect.x0, Rect.y1 - StripHeight, Rect.x1, Rect.y1)
+    return Page.get_text("text", clip=TopStrip) + Page.get_text("text", clip=BottomStrip)
+
+def FrontMatterTextLength(Metadata) -> int:
+    """Stripped length of the first, title and copyright page text - the OCR gate's measure"""
+    return sum(len(Metadata[Field].strip()) for Field in
+               ('first_page_text', 'title_page_text', 'copyright_page_text'))
+
+def ImageCoverage(Page) -> float:
+    """Share of the page area covered by image blocks (about 1.0 for a scanned page)"""
+    PageRect = Page.rect
+    PageArea = abs(PageRect)
+    if not PageArea:
+        return 0.0
+    
+    Blocks = Page.get_text("blocks", flags=fitz.TEXTFLAGS_BLOCKS | fitz.TEXT_PRESERVE_IMAGES)
+    Covered = sum(abs(fitz.Rect(Block[:4]) & PageRect) for Block in Blocks if Block[6] == 1)
+    return min(Covered / PageArea, 1.0)
+
+# ===== OCR PAGE WORKERS =====
+
+_WorkerTesseractAPI = None
+
+def InitializeOCRWorker():
+    """Process-pool initializer: one single-threaded Tesseract API per worker"""
+    global _WorkerTesseractAPI
+    
+    # Parallelism comes from the pool - stop Tesseract's OpenMP oversubscribing cores
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+    
+    try:
+        import tesserocr
+        _WorkerTesseractAPI = tesserocr.PyTessBaseAPI(lang='eng')
+    except ImportError:
+        _WorkerTesseractAPI = None
+
+def RenderPageForOCR(Page, Dpi):
+    """Render a PDF page straight to an 8-bit grayscale pixmap"""
+    return Page.get_pixmap(dpi=Dpi, colorspace=fitz.csGRAY, alpha=False)
+
+def PixmapToArray(Pixmap):
+    """Zero-copy (height, width) uint8 view of a grayscale pixmap - valid while Pixmap lives"""
+    return np.frombuffer(Pixmap.samples_mv, dtype=np.uint8).reshape(Pixmap.height, Pixmap.stride)[:, :Pixmap.width]
+
+def PixmapToImage(Pixmap):
+    """PIL copy of a grayscale pixmap, for engines that only take PIL images"""
+    return Image.frombytes('L', (Pixmap.width, Pixmap.height), Pixmap.samples)
+
+def SetTesseractPixmap(API, Pixmap):
+    """Hand raw grayscale pixels to tesserocr - no PIL image or in-memory image file"""
+    API.SetImageBytes(Pixmap.samples, Pixmap.width, Pixmap.height, 1, Pixmap.stride)
+
+def RetryLowConfidencePage(API, Page, Text):
+    """
+    Re-OCR a page at OCR_DPI when the OCR_RENDER_DPI pass came back unsure
+    
+    Args:
+        API: tesserocr API that just recognized the low-resolution render
+        Page: PyMuPDF page to re-render
+        Text: Text from the low-resolution pass
+        
+    Returns:
+        str: Whichever pass Tesseract was more confident in
+    """
+    Confidence = API.MeanTextConf()
+    if not Text.strip() or Confidence >= OCR_RETRY_CONFIDENCE:
+        return Text
+    
+    SetTesseractPixmap(API, RenderPageForOCR(Page, OCR_DPI))
+    RetryText = API.GetUTF8Text()
+    return RetryText if API.MeanTextConf() > Confidence else Text
+
+def RetryLowConfidenceBoxes(Reader, Page, PageResults):
+    """
+    Re-read the EasyOCR boxes the OCR_RENDER_DPI pass was unsure about from one
+    OCR_DPI render of the page - detection itself stays at the low resolution.
+    All retried boxes (at most EASYOCR_RETRY_MAX_BOXES) go through a single
+    batched recognize() call.
+    
+    Args:
+        Reader: EasyOCR reader that produced PageResults
+        Page: PyMuPDF page the results came from
+        PageResults: (box, text, confidence) tuples for the OCR_RENDER_DPI render
+        
+    Returns:
+        list: Text per box, whichever read was more confident
+    """
+    Texts = [Text for _, Text, _ in PageResults]
+    RetryIndexes = sorted((Index for Index, (_, _, Confidence) in enumerate(PageResults)
+                           if Confidence < EASYOCR_RETRY_CONFIDENCE),
+                          key=lambda Index: PageResults[Index][2])[:EASYOCR_RETRY_MAX_BOXES]
+    if not RetryIndexes:
+        return Texts
+    
+    Render = Page.get_pixmap(dpi=OCR_DPI, colorspace=fitz.csGRAY, alpha=False)
+    Factor = OCR_DPI / OCR_RENDER_DPI
+    
+    # recognize() returns boxes sorted top to bottom, labelled with their clamped
+    # top-left corner - that corner maps each read back to its box
+    HorizontalList = []
+    BoxesByCorner = {}
+    for Index in RetryIndexes:
+        Box = PageResults[Index][0]
+        XMin = min(max(int(min(Point[0] for Point in Box) * Factor), 0), Render.width)
+        XMax = min(int(max(Point[0] for Point in Box) * Factor) + 1, Render.width)
+        YMin = min(max(int(min(Point[1] for Point in Box) * Factor), 0), Render.height)
+        YMax = min(int(max(Point[1] for Point in Box) * Factor) + 1, Render.height)
+        if XMax > XMin and YMax > YMin:
+            HorizontalList.append([XMin, XMax, YMin, YMax])
+            BoxesByCorner.setdefault((XMin, YMin), []).append(Index)
+    
+    if not HorizontalList:
+        return Texts
+    
+    Retries = Reader.recognize(PixmapToArray(Render), horizontal_list=HorizontalList, free_list=[],
+                               batch_size=GPU_BATCH_SIZE)
+    for RetryBox, RetryText, RetryConfidence in Retries:
+        Waiting = BoxesByCorner.get((int(RetryBox[0][0]), int(RetryBox[0][1])))
+        if Waiting:
+            Index = Waiting.pop(0)
+            if RetryConfidence > PageResults[Index][2]:
+                Texts[Index] = RetryText
+    
+    return Texts
+
+def OCRPageWorker(Task):
+    """Render one page with PyMuPDF and OCR it with Tesseract; returns (PageNum, Text)"""
+    PDFPath, PageNum = Task
+    
+    with fitz.open(PDFPath) as Doc:
+        Page = Doc[PageNum]
+        Pixmap = RenderPageForOCR(Page, OCR_RENDER_DPI)
+        
+        if _WorkerTesseractAPI is not None:
+            SetTesseractPixmap(_WorkerTesseractAPI, Pixmap)
+            return PageNum, RetryLowConfidencePage(_WorkerTesseractAPI, Page, _WorkerTesseractAPI.GetUTF8Text())
+    
+    import pytesseract
+    return PageNum, pytesseract.image_to_string(PixmapToImage(Pixmap), lang='eng')
+
+def EnableHalfPrecision(Module):
+    """
+    Run a torch module's forward under fp16 autocast and hand back float32 outputs,
+    so EasyOCR's numpy/cv2 post-processing sees the dtype it expects
+    """
+    import torch
+    Forward = Module.forward
+    
+    def AutocastForward(*Args, **Kwargs):
+        with torch.autocast('cuda', dtype=torch.float16):
+            Outputs = Forward(*Args, **Kwargs)
+        if isinstance(Outputs, tuple):
+            return tuple(Output.float() for Output in Outputs)
+        return Outputs.float()
+    
+    Module.forward = AutocastForward
+
+# ===== BOOK EXTRACTION WORKERS =====
+
+_WorkerExtractor = None
+
+def InitializeBookWorker(DatabaseBooks, DeferredEngine=None):
+    """
+    Process-pool initializer: one extractor per worker, sharing the parent's database lookup
+    
+    Args:
+        DatabaseBooks: The parent's title lookup
+        DeferredEngine: The parent's GPU engine name - the worker then leaves OCR to the parent
+    """
+    global _WorkerExtractor
+    
+    # One book per core already - keep Tesseract single-threaded
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+    
+    # The parent has already logged the hardware configuration
+    with contextlib.redirect_stdout(io.StringIO()):
+        _WorkerExtractor = HimalayaPDFExtractor(DatabaseBooks=DatabaseBooks, DeferredEngine=DeferredEngine)
+
+def ExtractBookWorker(PDFPath, FileSize=None):
+    """Extract one PDF's metadata in a worker process; None when OCR is deferred to the parent"""
+    return _WorkerExtractor.ExtractPDFMetadata(PDFPath, FileSize)
+
 # ===== HIMALAYA HARDWARE MANAGER =====
 
 class HimalayaHardwareManager:
     """Himalaya-standard hardware acceleration management"""
     
-    def __init__(self):
-        print("🏔️ INITIALIZING HIMALAYA HARDWARE MANAGER")
-        print("=" * 60)
+    def __init__(self, DeferredEngine=None):
+        """
+        Args:
+            DeferredEngine: Engine of the parent process, for book workers that leave
+                OCR to it - no GPU detection or engine loading in this process
+        """
+        if DeferredEngine:
+            self.GPUCapabilities = {}
+            self.OCREngines = {}
+        else:
+            print("🏔️ INITIALIZING HIMALAYA HARDWARE MANAGER")
+            print("=" * 60)
+            
+            self.GPUCapabilities = self.DetectGPUCapabilities()
+            self.OCREngines = self.InitializeOCREngines()
+        
+        # In-process Tesseract API, created on first use and reused for every page
+        self.TesseractAPI = None
+        self.TesseractLock = threading.Lock()
         
-        self.GPUCapabilities = self.DetectGPUCapabilities()
-        self.OCREngines = self.InitializeOCREngines()
+        # EasyOCR reader, loaded onto the GPU once and reused for every batch
+        self.EasyOCRReader = None
+        self.EasyOCRLock = threading.Lock()
         self.PerformanceMetrics = {
             'GPU_Operations': 0,
             'CPU_Operations': 0,
@@ -322,7 +799,12 @@ class HimalayaHardwareManager:
             'Timeout_Failures': 0
         }
         
+        if DeferredEngine:
+            self.ActiveEngine = DeferredEngine
+            return
+        
         self.ActiveEngine = self.SelectOptimalEngine()
+        self.WarmUpOCREngine()
         self.LogHimalayaConfiguration()
     
     def DetectGPUCapabilities(self):
@@ -361,6 +843,7 @@ class HimalayaHardwareManager:
         """Initialize available OCR engines"""
         Engines = {
             'TesseractGPU': False,
+            'TesseractAPI': False,
             'TesseractCPU': False,
             'EasyOCR': False,
             'PaddleOCR': False
@@ -374,6 +857,14 @@ class HimalayaHardwareManager:
         except ImportError:
             print("❌ Tesseract not available")
         
+        # Test in-process Tesseract API (no tesseract subprocess per page)
+        try:
+            import tesserocr
+            Engines['TesseractAPI'] = True
+            print("✅ Tesseract in-process API available (tesserocr)")
+        except ImportError:
+            print("⚠️ tesserocr not available - Tesseract runs as a subprocess per page")
+        
         # Test EasyOCR availability
         try:
             import easyocr
@@ -391,11 +882,29 @@ class HimalayaHardwareManager:
         """Select the best available OCR engine"""
         if self.OCREngines['EasyOCR'] and self.GPUCapabilities['CUDA_Available']:
             return 'EasyOCR-GPU'
+        elif self.OCREngines['TesseractAPI']:
+            return 'Tesseract-API'
         elif self.OCREngines['TesseractCPU']:
             return 'Tesseract-CPU'
         else:
             return 'CPU-Fallback'
     
+    def WarmUpOCREngine(self):
+        """
+        Load the GPU reader and run one blank letter-size page through it, so model
+        loading and cuDNN autotuning happen here rather than on the first book
+        """
+        if self.ActiveEngine != 'EasyOCR-GPU':
+            return
+        
+        try:
+            StartTime = time.time()
+            BlankPage = np.zeros((11 * OCR_RENDER_DPI, 17 * OCR_RENDER_DPI // 2), dtype=np.uint8)
+            self.GetEasyOCRReader().readtext(BlankPage)
+            print(f"🔥 EasyOCR warmed up in {time.time() - StartTime:.1f}s")
+        except Exception as WarmUpError:
+            print(f"⚠️ EasyOCR warm-up failed: {str(WarmUpError)[:50]}")
+    
     def LogHimalayaConfiguration(self):
         """Log the Himalaya hardware configuration"""
         print("\n📋 HIMALAYA CONFIGURATION:")
@@ -404,15 +913,106 @@ class HimalayaHardwareManager:
         print(f"   💾 Available Memory: {self.GPUCapabilities['GPU_Memory_GB']:.1f} GB")
         print(f"   ⚡ Hardware Ready: {'✅' if self.ActiveEngine != 'CPU-Fallback' else '⚠️'}")
     
-    def ProcessImageWithOptimalEngine(self, Image, Context=""):
-        """Process image with the optimal available engine"""
+    def GetTesseractAPI(self):
+        """Return the shared tesserocr API, loading the language model once"""
+        if self.TesseractAPI is None:
+            import tesserocr
+            self.TesseractAPI = tesserocr.PyTessBaseAPI(lang='eng')
+        return self.TesseractAPI
+    
+    def GetEasyOCRReader(self):
+        """Return the shared EasyOCR reader, loading the models onto the GPU once"""
+        if self.EasyOCRReader is None:
+            import easyocr
+            import torch
+            Reader = easyocr.Reader(['en'], gpu=True)
+            
+            # Set after the reader is built - easyocr resets the flag while loading its
+            # models; autotuned kernels are then reused for same-size pages
+            torch.backends.cudnn.benchmark = True
+            
+            ComputeCapability = self.GPUCapabilities.get('GPU_Compute_Capability')
+            if EASYOCR_FP16 and ComputeCapability and ComputeCapability[0] >= 7:
+                EnableHalfPrecision(Reader.detector)
+                EnableHalfPrecision(Reader.recognizer)
+            
+            self.EasyOCRReader = Reader
+        return self.EasyOCRReader
+    
+    def ReleaseOCREngines(self):
+        """Free the in-process Tesseract API and EasyOCR reader"""
+        with self.TesseractLock:
+            if self.TesseractAPI is not None:
+                self.TesseractAPI.End()
+                self.TesseractAPI = None
+        
+        with self.EasyOCRLock:
+            self.EasyOCRReader = None
+    
+    def ProcessBatchWithEasyOCR(self, Pixmaps, Context="", Pages=None):
+        """
+        OCR several page renders with batched EasyOCR calls instead of one call per page
+        
+        Args:
+            Pixmaps: Grayscale PyMuPDF page renders
+            Context: Label for error messages
+            Pages: Source PyMuPDF pages, one per pixmap - low-confidence boxes are
+                then re-read from an OCR_DPI render
+            
+        Returns:
+            list: Text per pixmap, in input order
+        """
+        Texts = [''] * len(Pixmaps)
+        if not Pixmaps:
+            return Texts
+        
+        StartTime = time.time()
+        
+        # The detector stacks a batch into one array, so equal-size pages go together
+        SizeGroups = {}
+        for Index, Pixmap in enumerate(Pixmaps):
+            SizeGroups.setdefault((Pixmap.width, Pixmap.height), []).append(Index)
+        
+        try:
+            # Timed-out extractions may still be running in a daemon thread
+            with self.EasyOCRLock:
+                Reader = self.GetEasyOCRReader()
+                for Indexes in SizeGroups.values():
+                    Results = Reader.readtext_batched(
+                        [PixmapToArray(Pixmaps[Index]) for Index in Indexes],
+                        batch_size=GPU_BATCH_SIZE
+                    )
+                    for Index, PageResults in zip(Indexes, Results):
+                        if Pages is not None:
+                            Texts[Index] = ' '.join(RetryLowConfidenceBoxes(Reader, Pages[Index], PageResults))
+                        else:
+                            Texts[Index] = ' '.join([Result[1] for Result in PageResults])
+            
+            self.PerformanceMetrics['GPU_Operations'] += len(Pixmaps)
+            self.PerformanceMetrics['GPU_Time'] += time.time() - StartTime
+            
+        except Exception as OCRError:
+            self.PerformanceMetrics['GPU_Errors'] += 1
+            print(f"   ❌ OCR error ({Context}): {str(OCRError)[:50]}")
+        
+        return Texts
+    
+    def ProcessImageWithOptimalEngine(self, Pixmap, Context="", Page=None):
+        """
+        Process image with the optimal available engine
+        
+        Args:
+            Pixmap: Grayscale PyMuPDF page render to OCR
+            Context: Label for error messages
+            Page: Source PyMuPDF page - lets the Tesseract API re-render it at OCR_DPI
+                when the first pass has low confidence
+        """
         StartTime = time.time()
         
         try:
             if self.ActiveEngine == 'EasyOCR-GPU':
-                import easyocr
-                Reader = easyocr.Reader(['en'], gpu=True)
-                Results = Reader.readtext(np.array(Image))
+                with self.EasyOCRLock:
+                    Results = self.GetEasyOCRReader().readtext(PixmapToArray(Pixmap))
                 Text = ' '.join([Result[1] for Result in Results])
                 
                 self.PerformanceMetrics['GPU_Operations'] += 1
@@ -420,9 +1020,23 @@ class HimalayaHardwareManager:
                 
                 return Text
                 
+            elif self.ActiveEngine == 'Tesseract-API':
+                # Timed-out extractions may still be running in a daemon thread
+                with self.TesseractLock:
+                    API = self.GetTesseractAPI()
+                    SetTesseractPixmap(API, Pixmap)
+                    Text = API.GetUTF8Text()
+                    if Page is not None:
+                        Text = RetryLowConfidencePage(API, Page, Text)
+                
+                self.PerformanceMetrics['CPU_Operations'] += 1
+                self.PerformanceMetrics['CPU_Time'] += time.time() - StartTime
+                
+                return Text
+                
             elif self.ActiveEngine == 'Tesseract-CPU':
                 import pytesseract
-                Text = pytesseract.image_to_string(Image, lang='eng')
+                Text = pytesseract.image_to_string(PixmapToImage(Pixmap), lang='eng')
                 
                 self.PerformanceMetrics['CPU_Operations'] += 1
                 self.PerformanceMetrics['CPU_Time'] += time.time() - StartTime
@@ -465,7 +1079,14 @@ class HimalayaHardwareManager:
 class HimalayaPDFExtractor:
     """TIMEOUT-PROTECTED Himalaya-standard GPU-accelerated PDF extractor with enhanced bibliographic extraction"""
     
-    def __init__(self):
+    def __init__(self, DatabaseBooks=None, DeferredEngine=None):
+        """
+        Args:
+            DatabaseBooks: Preloaded title lookup - given only to book worker processes,
+                which then skip the resume scan and database load
+            DeferredEngine: Parent's GPU engine name, for book workers - books that
+                need OCR are handed back to the parent, which owns the GPU
+        """
         print("🏔️ INITIALIZING HIMALAYA PDF EXTRACTOR (ENHANCED BIBLIOGRAPHIC)")
         print("Standard: AIDEV-PascalCase-1.8 (Hardware-Accelerated + Timeout Protection + Enhanced Bibliographic)")
         print("=" * 80)
@@ -475,7 +1096,13 @@ class HimalayaPDFExtractor:
         self.OutputFile = OUTPUT_CSV
         
         # Initialize Himalaya hardware manager
-        self.HardwareManager = HimalayaHardwareManager()
+        self.HardwareManager = HimalayaHardwareManager(DeferredEngine)
+        self.DeferOCR = DeferredEngine is not None
+        self.OCRPool = None  # Tesseract page pool, started on first OCR
+        self.BookPool = None  # whole-book worker pool
+        self.IsBookWorker = DatabaseBooks is not None
+        self.CSVWriter = None  # open only while ProcessAllPDFs runs
+        self.OutputDatabase = None  # likewise
         
         # Processing statistics
         self.ProcessedCount = 0
@@ -495,8 +1122,11 @@ class HimalayaPDFExtractor:
         }
         
         # Load existing data and database info
-        self.LoadExistingData()
-        self.LoadDatabaseInfo()
+        if self.IsBookWorker:
+            self.DatabaseBooks = DatabaseBooks
+        else:
+            self.LoadExistingData()
+            self.LoadDatabaseInfo()
     
     def LoadExistingData(self):
         """Load previously processed PDFs"""
@@ -504,8 +1134,11 @@ class HimalayaPDFExtractor:
         
         if os.path.exists(self.OutputFile):
             try:
-                ExistingDF = pd.read_csv(self.OutputFile)
-                self.ProcessedFiles = set(ExistingDF['filename'].str.replace('.pdf', '', regex=False))
+                # Only the filename column is needed - stream it instead of loading every text field
+                with open(self.OutputFile, newline='', encoding='utf-8') as CSVFile:
+                    self.ProcessedFiles = {
+                        Path(Row['filename']).stem for Row in csv.DictReader(CSVFile) if Row.get('filename')
+                    }
                 print(f"✅ Resuming: {len(self.ProcessedFiles)} PDFs already processed")
             except Exception as E:
                 print(f"⚠️ Could not load existing CSV: {E}")
@@ -519,8 +1152,16 @@ class HimalayaPDFExtractor:
         
         if os.path.exists(self.DatabasePath):
             try:
-                Conn = sqlite3.connect(self.DatabasePath)
+                # Read-only: the lookup never writes, and a bigger page cache plus
+                # memory-mapped reads speed up the one full-table join
+                Conn = sqlite3.connect(Path(self.DatabasePath).resolve().as_uri() + '?mode=ro', uri=True)
+                Conn.executescript(f"""
+                    PRAGMA cache_size = -{SQLITE_CACHE_KB};
+                    PRAGMA mmap_size = {SQLITE_MMAP_BYTES};
+                    PRAGMA temp_store = MEMORY;
+                """)
                 Cursor = Conn.cursor()
+                Cursor.arraysize = SQLITE_FETCH_SIZE
                 
                 Query = '''
                     SELECT b.title, c.category, s.subject 
@@ -529,13 +1170,17 @@ class HimalayaPDFExtractor:
                     LEFT JOIN categories c ON s.category_id = c.id
                 '''
                 
-                Books = Cursor.execute(Query).fetchall()
+                Cursor.execute(Query)
                 
-                for Title, Category, Subject in Books:
-                    self.DatabaseBooks[Title] = {
-                        'category': Category or 'Unknown',
-                        'subject': Subject or 'Unknown'
-                    }
+                # Stream the rows in batches rather than materializing the whole result;
+                # each title maps to a (category, subject) tuple of interned strings,
+                # so the few distinct names are stored once instead of once per book
+                while Books := Cursor.fetchmany():
+                    for Title, Category, Subject in Books:
+                        self.DatabaseBooks[Title] = (
+                            sys.intern(Category or 'Unknown'),
+                            sys.intern(Subject or 'Unknown')
+                        )
                 
                 Conn.close()
                 print(f"✅ Loaded {len(self.DatabaseBooks)} books from existing database")
@@ -548,13 +1193,25 @@ class HimalayaPDFExtractor:
             self.DatabaseBooks = {}
     
     @TimeoutProtected(TOTAL_PDF_TIMEOUT)
-    def ExtractPDFMetadata(self, PDFPath):
-        """TIMEOUT-PROTECTED PDF metadata extraction with enhanced bibliographic data"""
+    def ExtractPDFMetadata(self, PDFPath, FileSize=None):
+        """
+        TIMEOUT-PROTECTED PDF metadata extraction with enhanced bibliographic data
+        
+        Args:
+            PDFPath: PDF to extract
+            FileSize: Size in bytes from the directory scan; stat()ed here if not given
+            
+        Returns:
+            dict: CSV row - or None in a deferred-OCR book worker when the PDF needs OCR
+        """
         StartTime = time.time()
         
+        if FileSize is None:
+            FileSize = PDFPath.stat().st_size
+        
         Metadata = {
             'filename': PDFPath.name,
-            'file_size_mb': round(PDFPath.stat().st_size / (1024*1024), 2),
+            'file_size_mb': round(FileSize / (1024*1024), 2),
             'pdf_title': '',
             'pdf_author': '',
             'pdf_subject': '',
@@ -592,20 +1249,30 @@ class HimalayaPDFExtractor:
         
         # Get database info
         BookTitle = PDFPath.stem
-        if BookTitle in self.DatabaseBooks:
-            Metadata['database_category'] = self.DatabaseBooks[BookTitle]['category']
-            Metadata['database_subject'] = self.DatabaseBooks[BookTitle]['subject']
+        DatabaseEntry = self.DatabaseBooks.get(BookTitle)
+        if DatabaseEntry:
+            Metadata['database_category'], Metadata['database_subject'] = DatabaseEntry
         
         ExtractionMethods = []
         ErrorMessages = []
         AllExtractedText = []
+        TablesContent = []
+        HasTextLayer = False
+        
+        # Read the file from disk once; PyMuPDF and serial OCR both parse these bytes
+        PDFBytes = ReadPDFBytes(PDFPath)
         
         # TIMEOUT-PROTECTED Method 1: PyMuPDF primary extraction
         try:
             print(f"   📄 PyMuPDF extraction ({PDF_OPEN_TIMEOUT}s timeout)...")
             
             with PDFTimeout(PDF_OPEN_TIMEOUT, "PyMuPDF PDF opening"):
-                Doc = fitz.open(str(PDFPath))
+                Doc = OpenPDF(PDFPath, PDFBytes)
+                
+                # Encrypted with an empty user password: unlock instead of falling back to another parser
+                if Doc.needs_pass and not Doc.authenticate(""):
+                    raise ValueError("PDF is password protected")
+                
                 Metadata['page_count'] = len(Doc)
                 
                 # Extract basic PDF metadata
@@ -618,13 +1285,36 @@ class HimalayaPDFExtractor:
                     Metadata['pdf_producer'] = (PDFMetadata.get('producer') or '').strip()[:200]
                     Metadata['pdf_creation_date'] = (PDFMetadata.get('creationDate') or '').strip()[:50]
                 
+                # Pages that reference fonts carry a real text layer - OCR cannot add to it
+                FontCheckPages = range(min(FONT_CHECK_PAGES, len(Doc)))
+                HasTextLayer = any(Doc[PageNum].get_fonts() for PageNum in FontCheckPages)
+                
                 # Enhanced text extraction with timeout protection
                 TextToProcess = min(MAX_PAGES_TO_PROCESS, len(Doc))
+                CollectedLength = 0
                 
+                # One get_text() per page fills every bucket; stop once the front
+                # matter is found and enough text is collected for the search
                 for PageNum in range(TextToProcess):
+                    if (PageNum >= ABSTRACT_PAGE_LIMIT
+                            and Metadata['title_page_text']
+                            and Metadata['copyright_page_text']
+                            and Metadata['table_of_contents']
+                            and CollectedLength >= SEARCH_TEXT_LENGTH):
+                        TextToProcess = PageNum
+                        break
+                    
                     with PDFTimeout(PAGE_PROCESS_TIMEOUT, f"page {PageNum + 1} processing"):
                         Page = Doc[PageNum]
-                        PageText = Page.get_text()
+                        
+                        # Once the search text is full, lay out only the header/footer
+                        # strips and skip pages without a front-matter marker
+                        if CollectedLength >= SEARCH_TEXT_LENGTH:
+                            StripTextLower = ExtractPageStrips(Page).lower()
+                            if not any(Marker in StripTextLower for Marker in FRONT_MATTER_MARKERS):
+                                continue
+                        
+                        PageText = Page.get_text(flags=fitz.TEXTFLAGS_TEXT | fitz.TEXT_DEHYPHENATE)
                         
                         # Classify and store text by page type and content
                         PageTextLower = PageText.lower()
@@ -635,8 +1325,8 @@ class HimalayaPDFExtractor:
                             if not Metadata['title_page_text']:
                                 Metadata['title_page_text'] = PageText[:MAX_TEXT_LENGTH]
                         
-                        # Copyright page detection
-                        if 'copyright' in PageTextLower or '©' in PageText:
+                        # Copyright page detection - the front-matter page, not a later mention
+                        if not Metadata['copyright_page_text'] and ('copyright' in PageTextLower or '©' in PageText):
                             Metadata['copyright_page_text'] = PageText[:MAX_TEXT_LENGTH]
                         
                         # Table of contents detection
@@ -645,16 +1335,33 @@ class HimalayaPDFExtractor:
                                 Metadata['table_of_contents'] = PageText[:MAX_TEXT_LENGTH]
                         
                         # Abstract detection
-                        if 'abstract' in PageTextLower and PageNum < 5:
+                        if 'abstract' in PageTextLower and PageNum < ABSTRACT_PAGE_LIMIT:
                             Metadata['abstract_text'] = PageText[:MAX_TEXT_LENGTH//2]
                         
+                        # Tables come from the same parsed page - no second parser
+                        if EXTRACT_TABLES and PageNum < TABLE_PAGE_LIMIT:
+                            TablesContent.extend(ExtractPageTables(Page, PageNum))
+                        
                         AllExtractedText.append(PageText)
+                        CollectedLength += len(PageText) + 1
                 
-                # Create full text sample
-                if AllExtractedText:
-                    Metadata['full_text_sample'] = ' '.join(AllExtractedText)[:MAX_TEXT_LENGTH]
+                # Create full text sample - joining stops at MAX_TEXT_LENGTH
+                Metadata['full_text_sample'] = JoinTextPrefix(AllExtractedText, MAX_TEXT_LENGTH)
                 
                 ExtractionMethods.append('PyMuPDF')
+                
+                if TablesContent:
+                    ExtractionMethods.append('PyMuPDF-Tables')
+                    Metadata['enhanced_extraction'] = True
+                    Metadata['tables_content'] = '\n'.join(TablesContent)[:MAX_TEXT_LENGTH]
+                    print(f"   ✅ Table detection: {len(TablesContent)} tables extracted")
+                
+                # A scan with a stamped or watermark font still references fonts;
+                # little text on front pages that are mostly image means OCR is needed
+                if HasTextLayer and FrontMatterTextLength(Metadata) < OCR_TEXT_THRESHOLD:
+                    HasTextLayer = not all(ImageCoverage(Doc[PageNum]) >= SCAN_IMAGE_COVERAGE
+                                           for PageNum in FontCheckPages)
+                
                 Doc.close()
                 print(f"   ✅ PyMuPDF completed: {TextToProcess} pages extracted")
             
@@ -665,66 +1372,19 @@ class HimalayaPDFExtractor:
             ErrorMessages.append(f"PyMuPDF: {str(PyMuPDFError)[:100]}")
             print(f"   ❌ PyMuPDF failed: {str(PyMuPDFError)[:50]}")
         
-        # TIMEOUT-PROTECTED Method 2: PDFPlumber enhanced extraction
-        TextQuality = len(' '.join(filter(None, [
-            Metadata.get('first_page_text', ''),
-            Metadata.get('title_page_text', ''),
-            Metadata.get('copyright_page_text', '')
-        ])).strip())
+        # Measure front-matter text once for the OCR gate
+        # (summed lengths - no need to build the joined string)
+        TextQuality = FrontMatterTextLength(Metadata)
         
-        if TextQuality < 500:
-            try:
-                print(f"   🔧 PDFPlumber extraction (20s timeout)...")
-                
-                @TimeoutProtected(20)
-                def ExtractWithPlumber():
-                    with pdfplumber.open(PDFPath) as PDF:
-                        # Enhanced metadata extraction
-                        if PDF.metadata:
-                            for Key, Value in PDF.metadata.items():
-                                if Key == 'Title' and not Metadata['pdf_title']:
-                                    Metadata['pdf_title'] = str(Value).strip()[:500]
-                                elif Key == 'Author' and not Metadata['pdf_author']:
-                                    Metadata['pdf_author'] = str(Value).strip()[:200]
-                        
-                        # Extract tables with timeout protection
-                        TablesContent = []
-                        PagesToCheck = min(4, len(PDF.pages))
-                        
-                        for PageNum in range(PagesToCheck):
-                            Page = PDF.pages[PageNum]
-                            Tables = Page.extract_tables()
-                            if Tables:
-                                for TableNum, Table in enumerate(Tables[:2]):
-                                    TableText = f"Table {TableNum + 1} (Page {PageNum + 1}):\n"
-                                    for Row in Table[:10]:
-                                        if Row:
-                                            TableText += " | ".join(str(Cell)[:50] if Cell else "" for Cell in Row) + "\n"
-                                    TablesContent.append(TableText)
-                        
-                        return TablesContent
-                
-                TablesContent = ExtractWithPlumber()
-                
-                if TablesContent:
-                    ExtractionMethods.append('PDFPlumber')
-                    Metadata['enhanced_extraction'] = True
-                    Metadata['tables_content'] = '\n'.join(TablesContent)[:MAX_TEXT_LENGTH]
-                    self.EnhancedExtractionCount += 1
-                    print(f"   ✅ PDFPlumber completed: {len(TablesContent)} tables extracted")
+        # TIMEOUT-PROTECTED Method 2: Himalaya GPU-accelerated OCR - image-only PDFs,
+        # not born-digital ones whose front matter is merely short
+        if TextQuality < OCR_TEXT_THRESHOLD and not HasTextLayer:
+            if self.DeferOCR:
+                return None
             
-            except TimeoutError:
-                ErrorMessages.append("PDFPlumber: Timeout after 20 seconds")
-                print(f"   ⏰ PDFPlumber timed out")
-            except Exception as PlumberError:
-                ErrorMessages.append(f"PDFPlumber: {str(PlumberError)[:100]}")
-                print(f"   ❌ PDFPlumber failed: {str(PlumberError)[:50]}")
-        
-        # TIMEOUT-PROTECTED Method 3: Himalaya GPU-accelerated OCR
-        if TextQuality < 200:
             try:
                 print(f"   🔍 OCR processing ({OCR_TIMEOUT}s timeout)...")
-                OCRData = self.ExtractTextWithHimalayaOCR(PDFPath)
+                OCRData = self.ExtractTextWithHimalayaOCR(PDFPath, PDFBytes)
                 ExtractionMethods.append('HimalayaOCR')
                 Metadata['ocr_used'] = True
                 
@@ -744,8 +1404,8 @@ class HimalayaPDFExtractor:
                 print(f"   ❌ OCR failed: {str(OCRError)[:50]}")
         
         # ===== ENHANCED BIBLIOGRAPHIC INFORMATION EXTRACTION =====
-        # Combine all text with priority weighting
-        AllText = ' '.join(filter(None, AllExtractedText))[:100000]
+        # Combine text with priority weighting - only the prefix the search reads is built
+        SearchText = JoinTextPrefix(AllExtractedText, SEARCH_TEXT_LENGTH)
         
         # Prioritize copyright and title page text for bibliographic extraction
         CopyrightText = Metadata.get('copyright_page_text', '')
@@ -755,81 +1415,61 @@ class HimalayaPDFExtractor:
         SearchTexts = [
             (CopyrightText, 3),  # Highest priority - copyright pages have most metadata
             (TitleText, 2),      # Medium priority - title pages  
-            (AllText[:25000], 1) # Lower priority, limited text to avoid noise
+            (SearchText, 1)      # Lower priority, limited text to avoid noise
         ]
         
+        # Scan each search text once for every identifier pattern
+        TextHits = [(BIBLIOGRAPHIC_SCANNER.Scan(Text), Priority) for Text, Priority in SearchTexts if Text]
+        
         # Extract ISBNs with enhanced validation
-        for Text, Priority in SearchTexts:
-            if Text and not Metadata['extracted_isbn']:
-                for Pattern in ISBN_PATTERNS:
-                    Matches = Pattern.findall(Text)
-                    for Match in Matches:
-                        ISBN = ValidateISBN(Match)
-                        if ISBN:
-                            Metadata['extracted_isbn'] = ISBN
-                            self.BibliographicHitCount['ISBN'] += 1
-                            break
-                    if Metadata['extracted_isbn']:
-                        break
+        for Hits, Priority in TextHits:
+            ISBN = FirstValidMatch(Hits.get('ISBN', []), ValidateISBN)
+            if ISBN:
+                Metadata['extracted_isbn'] = ISBN
+                break
         
         # Extract LCCNs (NEW) - Library of Congress Control Numbers
-        for Text, Priority in SearchTexts:
-            if Text and not Metadata['extracted_lccn']:
-                for Pattern in LCCN_PATTERNS:
-                    Matches = Pattern.findall(Text)
-                    for Match in Matches:
-                        LCCN = ValidateLCCN(Match)
-                        if LCCN:
-                            Metadata['extracted_lccn'] = LCCN
-                            self.BibliographicHitCount['LCCN'] += 1
-                            break
-                    if Metadata['extracted_lccn']:
-                        break
+        for Hits, Priority in TextHits:
+            LCCN = FirstValidMatch(Hits.get('LCCN', []), ValidateLCCN)
+            if LCCN:
+                Metadata['extracted_lccn'] = LCCN
+                break
         
         # Extract ISSNs (NEW) - International Standard Serial Numbers
-        for Text, Priority in SearchTexts:
-            if Text and not Metadata['extracted_issn']:
-                ISSNMatch = ExtractWithPatterns(Text, ISSN_PATTERNS)
-                if ISSNMatch:
-                    CleanISSN = re.sub(r'[\s]', '', ISSNMatch)
-                    if len(CleanISSN) == 8:
-                        CleanISSN = CleanISSN[:4] + '-' + CleanISSN[4:]
-                    if re.match(r'^\d{4}-\d{4}$', CleanISSN):
-                        Metadata['extracted_issn'] = CleanISSN
-                        self.BibliographicHitCount['ISSN'] += 1
-                        break
+        for Hits, Priority in TextHits:
+            ISSNMatch = FirstValidMatch(Hits.get('ISSN', []))
+            if ISSNMatch:
+                CleanISSN = re.sub(r'[\s]', '', ISSNMatch)
+                if len(CleanISSN) == 8:
+                    CleanISSN = CleanISSN[:4] + '-' + CleanISSN[4:]
+                if re.match(r'^\d{4}-\d{4}$', CleanISSN):
+                    Metadata['extracted_issn'] = CleanISSN
+                    break
         
         # Extract OCLC numbers (NEW) - WorldCat catalog numbers
-        for Text, Priority in SearchTexts:
-            if Text and not Metadata['extracted_oclc']:
-                OCLCMatch = ExtractWithPatterns(Text, OCLC_PATTERNS)
-                if OCLCMatch and re.match(r'^\d{8,12}$', OCLCMatch):
-                    Metadata['extracted_oclc'] = OCLCMatch
-                    self.BibliographicHitCount['OCLC'] += 1
-                    break
+        for Hits, Priority in TextHits:
+            OCLCMatch = FirstValidMatch(Hits.get('OCLC', []))
+            if OCLCMatch and re.match(r'^\d{8,12}$', OCLCMatch):
+                Metadata['extracted_oclc'] = OCLCMatch
+                break
         
         # Enhanced DOI extraction
-        for Text, Priority in SearchTexts:
-            if Text and not Metadata['extracted_doi']:
-                DOIMatch = ExtractWithPatterns(Text, DOI_PATTERNS)
-                if DOIMatch:
-                    Metadata['extracted_doi'] = DOIMatch
-                    self.BibliographicHitCount['DOI'] += 1
-                    break
+        for Hits, Priority in TextHits:
+            DOIMatch = FirstValidMatch(Hits.get('DOI', []))
+            if DOIMatch:
+                Metadata['extracted_doi'] = DOIMatch
+                break
         
         # Enhanced year extraction with priority
         YearCandidates = []
-        for Text, Priority in SearchTexts:
-            if Text:
-                for Pattern in YEAR_PATTERNS:
-                    Years = Pattern.findall(Text)
-                    for Year in Years:
-                        try:
-                            YearInt = int(Year)
-                            if 1900 <= YearInt <= 2030:
-                                YearCandidates.append((YearInt, Priority))
-                        except:
-                            continue
+        for Hits, Priority in TextHits:
+            for Year in Hits.get('Year', []):
+                try:
+                    YearInt = int(Year)
+                    if 1900 <= YearInt <= 2030:
+                        YearCandidates.append((YearInt, Priority))
+                except:
+                    continue
         
         if YearCandidates:
             # Sort by priority then by most recent year
@@ -838,26 +1478,21 @@ class HimalayaPDFExtractor:
         
         # Enhanced publisher extraction with priority
         PublisherCandidates = []
-        for Text, Priority in SearchTexts:
-            if Text:
-                for Pattern in PUBLISHER_PATTERNS:
-                    Publishers = Pattern.findall(Text)
-                    for Pub in Publishers:
-                        if len(Pub.strip()) >= 5:
-                            PublisherCandidates.append((Pub.strip()[:200], Priority))
+        for Hits, Priority in TextHits:
+            for Pub in Hits.get('Publisher', []):
+                if len(Pub.strip()) >= 5:
+                    PublisherCandidates.append((Pub.strip()[:200], Priority))
         
         if PublisherCandidates:
             PublisherCandidates.sort(key=lambda x: x[1], reverse=True)
             Metadata['extracted_publisher'] = PublisherCandidates[0][0]
-            self.BibliographicHitCount['Publisher'] += 1
         
         # Enhanced edition extraction
-        for Text, Priority in SearchTexts:
-            if Text and not Metadata['extracted_edition']:
-                EditionMatch = ExtractWithPatterns(Text, EDITION_PATTERNS)
-                if EditionMatch:
-                    Metadata['extracted_edition'] = EditionMatch.strip()
-                    break
+        for Hits, Priority in TextHits:
+            EditionMatch = FirstValidMatch(Hits.get('Edition', []))
+            if EditionMatch:
+                Metadata['extracted_edition'] = EditionMatch.strip()
+                break
         
         # Enhanced Himalaya quality scoring with bibliographic weighting
         QualityFactors = [
@@ -877,7 +1512,7 @@ class HimalayaPDFExtractor:
             bool(Metadata['tables_content']) * 5,
             bool(Metadata['ocr_used']) * 10,
             bool(Metadata['enhanced_extraction']) * 5,
-            min(len(AllText) / 150, 15)
+            min(len(SearchText) / 150, 15)  # saturates long before SEARCH_TEXT_LENGTH
         ]
         
         Metadata['extraction_quality_score'] = min(100, sum(QualityFactors))
@@ -888,12 +1523,10 @@ class HimalayaPDFExtractor:
         Metadata['extraction_method'] = '+'.join(ExtractionMethods) if ExtractionMethods else 'Failed'
         Metadata['errors'] = '; '.join(ErrorMessages) if ErrorMessages else ''
         
-        self.TotalProcessingTime += ProcessingTime
-        
         return Metadata
     
     @TimeoutProtected(OCR_TIMEOUT)
-    def ExtractTextWithHimalayaOCR(self, PDFPath):
+    def ExtractTextWithHimalayaOCR(self, PDFPath, PDFBytes=None):
         """TIMEOUT-PROTECTED Himalaya OCR extraction"""
         OCRText = {
             'first_page_text': '',
@@ -908,76 +1541,238 @@ class HimalayaPDFExtractor:
             return OCRText
         
         try:
-            with tempfile.TemporaryDirectory() as TempDir:
-                # Reduced settings for reliability
-                Pages = convert_from_path(
-                    PDFPath, 
-                    dpi=200,  # Reduced from 350
-                    first_page=1,
-                    last_page=min(6, 10),  # Max 6 pages
-                    output_folder=TempDir
-                )
+            # Tesseract pages run in parallel worker processes; the GPU engine
+            # keeps its single in-process reader, and book workers are already
+            # one per core
+            if self.HardwareManager.ActiveEngine in ('Tesseract-API', 'Tesseract-CPU') and not self.IsBookWorker:
+                PageTexts = self.OCRPagesInPool(PDFPath, PDFBytes)
+            elif self.HardwareManager.ActiveEngine == 'EasyOCR-GPU':
+                PageTexts = self.OCRPagesInBatch(PDFPath, PDFBytes)
+            else:
+                PageTexts = self.OCRPagesSerially(PDFPath, PDFBytes)
+            
+            for PageNum, PageText in PageTexts:
+                # Enhanced content classification
+                PageTextLower = PageText.lower()
                 
-                PagesToProcess = min(4, len(Pages))  # Process max 4 pages
+                # Store by page position
+                if PageNum == 0:
+                    OCRText['first_page_text'] = PageText[:MAX_TEXT_LENGTH]
+                elif PageNum == 1:
+                    OCRText['title_page_text'] = PageText[:MAX_TEXT_LENGTH]
                 
-                for PageNum in range(PagesToProcess):
-                    try:
-                        PageImage = Pages[PageNum]
-                        PageText = self.HardwareManager.ProcessImageWithOptimalEngine(
-                            PageImage, 
-                            f"page {PageNum + 1} of {PDFPath.name}"
-                        )
-                        
-                        # Enhanced content classification
-                        PageTextLower = PageText.lower()
-                        
-                        # Store by page position
-                        if PageNum == 0:
-                            OCRText['first_page_text'] = PageText[:MAX_TEXT_LENGTH]
-                        elif PageNum == 1:
-                            OCRText['title_page_text'] = PageText[:MAX_TEXT_LENGTH]
-                        
-                        # Store by content type
-                        if 'copyright' in PageTextLower or '©' in PageText:
-                            OCRText['copyright_page_text'] = PageText[:MAX_TEXT_LENGTH]
-                        
-                        if any(Keyword in PageTextLower for Keyword in ['contents', 'chapter', 'index']):
-                            if len(PageText) > len(OCRText['table_of_contents']):
-                                OCRText['table_of_contents'] = PageText[:MAX_TEXT_LENGTH]
-                        
-                        if 'abstract' in PageTextLower and PageNum < 3:
-                            OCRText['abstract_text'] = PageText[:MAX_TEXT_LENGTH//2]
-                        
-                        # Collect for full text sample
-                        if not OCRText['full_text_sample']:
-                            OCRText['full_text_sample'] = PageText[:MAX_TEXT_LENGTH]
-                        
-                    except Exception as PageError:
-                        print(f"   ⚠️ OCR page {PageNum + 1} error: {str(PageError)[:50]}")
-                        continue
+                # Store by content type
+                if 'copyright' in PageTextLower or '©' in PageText:
+                    OCRText['copyright_page_text'] = PageText[:MAX_TEXT_LENGTH]
                 
-                self.OCRCount += 1
-                return OCRText
+                if any(Keyword in PageTextLower for Keyword in ['contents', 'chapter', 'index']):
+                    if len(PageText) > len(OCRText['table_of_contents']):
+                        OCRText['table_of_contents'] = PageText[:MAX_TEXT_LENGTH]
+                
+                if 'abstract' in PageTextLower and PageNum < 3:
+                    OCRText['abstract_text'] = PageText[:MAX_TEXT_LENGTH//2]
+                
+                # Collect for full text sample
+                if not OCRText['full_text_sample']:
+                    OCRText['full_text_sample'] = PageText[:MAX_TEXT_LENGTH]
+            
+            return OCRText
                 
         except Exception as OCRError:
             print(f"   ❌ OCR processing failed: {str(OCRError)[:50]}")
             return OCRText
     
+    def OCRPagesSerially(self, PDFPath, PDFBytes=None):
+        """OCR the front pages one at a time with the active in-process engine"""
+        PageTexts = []
+        
+        # Render with PyMuPDF directly - no poppler subprocess or temp PNGs,
+        # and only the pages that will actually be OCR'd
+        with OpenPDF(PDFPath, PDFBytes) as Doc:
+            PagesToProcess = min(OCR_PAGE_LIMIT, len(Doc))  # Process max 4 pages
+            
+            for PageNum in range(PagesToProcess):
+                try:
+                    Page = Doc[PageNum]
+                    Pixmap = RenderPageForOCR(Page, OCR_RENDER_DPI)
+                    PageText = self.HardwareManager.ProcessImageWithOptimalEngine(
+                        Pixmap, 
+                        f"page {PageNum + 1} of {PDFPath.name}",
+                        Page
+                    )
+                    PageTexts.append((PageNum, PageText))
+                    
+                except Exception as PageError:
+                    print(f"   ⚠️ OCR page {PageNum + 1} error: {str(PageError)[:50]}")
+                    continue
+        
+        return PageTexts
+    
+    def OCRPagesInBatch(self, PDFPath, PDFBytes=None):
+        """Render the front pages, then OCR them together in batched GPU calls"""
+        PageNums = []
+        Pages = []
+        Pixmaps = []
+        
+        # The document stays open for the OCR so unsure boxes can be re-rendered
+        with OpenPDF(PDFPath, PDFBytes) as Doc:
+            PagesToProcess = min(OCR_PAGE_LIMIT, len(Doc))  # Process max 4 pages
+            
+            for PageNum in range(PagesToProcess):
+                try:
+                    Page = Doc[PageNum]
+                    Pixmaps.append(RenderPageForOCR(Page, OCR_RENDER_DPI))
+                    Pages.append(Page)
+                    PageNums.append(PageNum)
+                except Exception as PageError:
+                    print(f"   ⚠️ OCR page {PageNum + 1} error: {str(PageError)[:50]}")
+            
+            PageTexts = self.HardwareManager.ProcessBatchWithEasyOCR(Pixmaps, PDFPath.name, Pages)
+        
+        return list(zip(PageNums, PageTexts))
+    
+    def OCRPagesInPool(self, PDFPath, PDFBytes=None):
+        """OCR the front pages concurrently in the Tesseract worker pool, in page order"""
+        with OpenPDF(PDFPath, PDFBytes) as Doc:
+            PagesToProcess = min(OCR_PAGE_LIMIT, len(Doc))  # Process max 4 pages
+        
+        StartTime = time.time()
+        Pool = self.GetOCRPool()
+        Futures = {
+            Pool.submit(OCRPageWorker, (str(PDFPath), PageNum)): PageNum
+            for PageNum in range(PagesToProcess)
+        }
+        
+        PageTexts = []
+        for Future in as_completed(Futures):
+            try:
+                PageTexts.append(Future.result())
+            except Exception as PageError:
+                print(f"   ⚠️ OCR page {Futures[Future] + 1} error: {str(PageError)[:50]}")
+        
+        PageTexts.sort()
+        
+        Metrics = self.HardwareManager.PerformanceMetrics
+        Metrics['CPU_Operations'] += len(PageTexts)
+        Metrics['CPU_Time'] += time.time() - StartTime
+        
+        return PageTexts
+    
+    def GetOCRPool(self):
+        """Start the Tesseract page pool on first use"""
+        if self.OCRPool is None:
+            # forkserver: workers never inherit the timeout threads of this process
+            StartMethod = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+            self.OCRPool = ProcessPoolExecutor(
+                max_workers=OCR_WORKERS,
+                mp_context=multiprocessing.get_context(StartMethod),
+                initializer=InitializeOCRWorker
+            )
+        return self.OCRPool
+    
+    def ScheduleExtractions(self, PDFFiles):
+        """
+        Yield one zero-argument callable per PDF that produces its metadata, in order
+        
+        At most MAX_PENDING_BOOKS books are in the worker pool at a time; the
+        next one is submitted as each callable is handed out, so finished
+        results never pile up ahead of the writer. With a CPU OCR engine the
+        workers do everything; the GPU engine keeps its single model in this
+        process, so workers hand back the books that need OCR and those are
+        extracted here when their turn comes. This process is then the slow
+        consumer, so workers only run MAX_PENDING_BOOKS_GPU books ahead.
+        
+        Args:
+            PDFFiles: Iterable of (PDF path, size in bytes) tuples
+        """
+        if BOOK_WORKERS <= 1:
+            for PDFFile, FileSize in PDFFiles:
+                yield partial(self.ExtractPDFMetadata, PDFFile, FileSize)
+            return
+        
+        ActiveEngine = self.HardwareManager.ActiveEngine or ''
+        DeferredEngine = ActiveEngine if 'GPU' in ActiveEngine else None
+        LookAhead = MAX_PENDING_BOOKS_GPU if DeferredEngine else MAX_PENDING_BOOKS
+        
+        if self.BookPool is None:
+            # forkserver: workers never inherit the timeout threads of this process
+            StartMethod = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+            self.BookPool = ProcessPoolExecutor(
+                max_workers=BOOK_WORKERS,
+                mp_context=multiprocessing.get_context(StartMethod),
+                initializer=InitializeBookWorker,
+                initargs=(self.DatabaseBooks, DeferredEngine)
+            )
+        
+        PDFFiles = iter(PDFFiles)
+        Pending = deque((self.BookPool.submit(ExtractBookWorker, PDFFile, FileSize), PDFFile, FileSize)
+                        for PDFFile, FileSize in islice(PDFFiles, LookAhead))
+        while Pending:
+            Future, PDFFile, FileSize = Pending.popleft()
+            for NextFile, NextSize in islice(PDFFiles, 1):
+                Pending.append((self.BookPool.submit(ExtractBookWorker, NextFile, NextSize), NextFile, NextSize))
+            yield partial(self.CompleteExtraction, Future, PDFFile, FileSize)
+    
+    def CompleteExtraction(self, Future, PDFFile, FileSize):
+        """A book worker's result, or a full in-process extraction when the worker deferred OCR"""
+        Metadata = Future.result()
+        if Metadata is None:
+            Metadata = self.ExtractPDFMetadata(PDFFile, FileSize)
+        return Metadata
+    
+    def ReuseExtraction(self, ContentHash, PDFFile, FileSize):
+        """An earlier book's record for a byte-identical PDF, relabelled for this file"""
+        StoredMetadata = self.OutputDatabase.FindExtraction(ContentHash)
+        if StoredMetadata is None:
+            return self.ExtractPDFMetadata(PDFFile, FileSize)
+        print(f"   ♻️ Same content as {StoredMetadata['filename']} - reusing its extraction")
+        
+        Metadata = dict(StoredMetadata)
+        for Column in ('ocr_used', 'enhanced_extraction', 'gpu_accelerated', 'timeout_protection'):
+            Metadata[Column] = bool(Metadata[Column])
+        Metadata['filename'] = PDFFile.name
+        Metadata['file_size_mb'] = round(FileSize / (1024*1024), 2)
+        Metadata['database_category'], Metadata['database_subject'] = self.DatabaseBooks.get(
+            PDFFile.stem, ('Not Found', 'Not Found'))
+        Metadata['processing_time_seconds'] = 0
+        return Metadata
+    
+    def RecordExtractionStats(self, Metadata):
+        """Fold one book's extraction results into the run statistics"""
+        self.TotalProcessingTime += Metadata['processing_time_seconds']
+        
+        if Metadata['ocr_used']:
+            self.OCRCount += 1
+        if Metadata['enhanced_extraction']:
+            self.EnhancedExtractionCount += 1
+        
+        for Identifier, Field in (('ISBN', 'extracted_isbn'), ('LCCN', 'extracted_lccn'),
+                                  ('ISSN', 'extracted_issn'), ('OCLC', 'extracted_oclc'),
+                                  ('DOI', 'extracted_doi'), ('Publisher', 'extracted_publisher')):
+            if Metadata[Field]:
+                self.BibliographicHitCount[Identifier] += 1
+    
     def ProcessAllPDFs(self):
         """Process all PDFs in the directory with enhanced progress reporting"""
         if not self.PDFDirectory.exists():
             print(f"❌ PDF directory not found: {self.PDFDirectory}")
             return False
         
-        PDFFiles = list(self.PDFDirectory.glob("*.pdf"))
-        TotalFiles = len(PDFFiles)
+        # One directory pass: count the PDFs and keep the unprocessed ones with
+        # their sizes, so nothing is listed or stat()ed twice
+        TotalFiles = 0
+        UnprocessedFiles = []
+        with os.scandir(self.PDFDirectory) as Entries:
+            for Entry in Entries:
+                if Entry.name.endswith('.pdf') and not Entry.name.startswith('.') and Entry.is_file():
+                    TotalFiles += 1
+                    if Entry.name[:-4] not in self.ProcessedFiles:
+                        UnprocessedFiles.append((Path(Entry.path), Entry.stat().st_size))
         
         if TotalFiles == 0:
             print(f"❌ No PDF files found in {self.PDFDirectory}")
             return False
         
-        # Filter out already processed files
-        UnprocessedFiles = [F for F in PDFFiles if F.stem not in self.ProcessedFiles]
         RemainingCount = len(UnprocessedFiles)
         
         print(f"\n📊 HIMALAYA EXTRACTION SUMMARY:")
@@ -1000,95 +1795,133 @@ class HimalayaPDFExtractor:
         
         print(f"🔄 Starting timeout-protected Himalaya extraction of {RemainingCount} files...\n")
         
-        # Process PDFs with timeout protection
-        for FileIndex, PDFFile in enumerate(UnprocessedFiles, 1):
-            try:
-                print(f"[{FileIndex:4d}/{RemainingCount}] Processing: {PDFFile.name}")
-                
-                # TIMEOUT-PROTECTED EXTRACTION
+        # One handle for the whole run; header only if the file is new
+        FileExists = os.path.exists(self.OutputFile)
+        with open(self.OutputFile, 'a', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as CSVFile, \
+                ExtractionDatabase(OUTPUT_DATABASE) as OutputDatabase:
+            self.CSVWriter = csv.DictWriter(CSVFile, fieldnames=CSV_COLUMNS)
+            self.OutputDatabase = OutputDatabase
+            if not FileExists:
+                self.CSVWriter.writeheader()
+            
+            # Renamed or duplicated PDFs whose content was extracted before are
+            # served from the output database instead of being extracted again;
+            # only the keys are known up front, each record is read when its turn comes
+            ContentHashes = {PDFFile: ContentHash(PDFFile, FileSize) for PDFFile, FileSize in UnprocessedFiles}
+            KnownContent = {PDFFile for PDFFile, _ in UnprocessedFiles
+                            if OutputDatabase.HasExtraction(ContentHashes[PDFFile])}
+            
+            # Books are extracted in worker processes where possible; results come
+            # back in order and only this process writes the outputs. Both are
+            # lazy, so each book's result is dropped once its row is written
+            Scheduled = self.ScheduleExtractions(
+                (PDFFile, FileSize) for PDFFile, FileSize in UnprocessedFiles if PDFFile not in KnownContent)
+            Extractions = (partial(self.ReuseExtraction, ContentHashes[PDFFile], PDFFile, FileSize)
+                           if PDFFile in KnownContent else next(Scheduled)
+                           for PDFFile, FileSize in UnprocessedFiles)
+            
+            # Process PDFs with timeout protection
+            for FileIndex, ((PDFFile, FileSize), Extract) in enumerate(zip(UnprocessedFiles, Extractions), 1):
                 try:
-                    ExtractedMetadata = self.ExtractPDFMetadata(PDFFile)
-                    self.AppendToCSV(ExtractedMetadata)
-                    self.ProcessedCount += 1
-                    
-                    # Display results with bibliographic info
-                    Quality = ExtractedMetadata['extraction_quality_score']
-                    ProcessingTime = ExtractedMetadata['processing_time_seconds']
-                    
-                    StatusFlags = []
-                    if ExtractedMetadata['ocr_used']:
-                        StatusFlags.append("🔍 OCR")
-                    if ExtractedMetadata['enhanced_extraction']:
-                        StatusFlags.append("⚡ Enhanced")
-                    if ExtractedMetadata['gpu_accelerated']:
-                        StatusFlags.append("🚀 GPU")
-                    if ExtractedMetadata.get('timeout_protection'):
-                        StatusFlags.append("⏰ Protected")
+                    print(f"[{FileIndex:4d}/{RemainingCount}] Processing: {PDFFile.name}")
                     
-                    # Add bibliographic flags
-                    BibFlags = []
-                    if ExtractedMetadata['extracted_isbn']:
-                        BibFlags.append("📚 ISBN")
-                    if ExtractedMetadata['extracted_lccn']:
-                        BibFlags.append("🏛️ LCCN")
-                    if ExtractedMetadata['extracted_issn']:
-                        BibFlags.append("📰 ISSN")
-                    if ExtractedMetadata['extracted_oclc']:
-                        BibFlags.append("🌐 OCLC")
-                    
-                    AllFlags = StatusFlags + BibFlags
-                    Status = " ".join(AllFlags) if AllFlags else "📄 Text"
-                    print(f"   ✅ Quality: {Quality:.0f}% | Time: {ProcessingTime:.1f}s | {Status}")
-                
-                except TimeoutError:
-                    # Handle timeout gracefully
-                    print(f"   ⏰ TIMEOUT after {TOTAL_PDF_TIMEOUT}s - marking as corrupted PDF")
-                    
-                    CorruptedMetadata = {
-                        'filename': PDFFile.name,
-                        'file_size_mb': round(PDFFile.stat().st_size / (1024*1024), 2),
-                        'page_count': 0,
-                        'database_category': 'Corrupted',
-                        'database_subject': 'Corrupted',
-                        'pdf_title': 'CORRUPTED PDF - TIMEOUT',
-                        'extraction_method': 'Timeout Protection',
-                        'errors': f'Timeout after {TOTAL_PDF_TIMEOUT}s - likely corrupted PDF structure',
-                        'extraction_quality_score': 0,
-                        'processing_time_seconds': TOTAL_PDF_TIMEOUT,
-                        'timeout_protection': True
-                    }
-                    
-                    # Fill in missing fields with empty values
-                    CSVColumns = [
-                        'pdf_author', 'pdf_subject', 'pdf_creator', 'pdf_producer',
-                        'pdf_creation_date', 'extracted_isbn', 'extracted_lccn', 'extracted_issn',
-                        'extracted_oclc', 'extracted_year', 'extracted_publisher', 'extracted_edition', 
-                        'extracted_doi', 'first_page_text', 'title_page_text', 'copyright_page_text',
-                        'table_of_contents', 'full_text_sample', 'abstract_text', 'tables_content',
-                        'ocr_used', 'enhanced_extraction', 'hardware_acceleration', 'gpu_accelerated'
-                    ]
+                    # TIMEOUT-PROTECTED EXTRACTION
+                    try:
+                        ExtractedMetadata = Extract()
+                        self.AppendRow(ExtractedMetadata, ContentHashes[PDFFile])
+                        self.RecordExtractionStats(ExtractedMetadata)
+                        self.ProcessedCount += 1
+                        
+                        # Display results with bibliographic info
+                        Quality = ExtractedMetadata['extraction_quality_score']
+                        ProcessingTime = ExtractedMetadata['processing_time_seconds']
+                        
+                        StatusFlags = []
+                        if ExtractedMetadata['ocr_used']:
+                            StatusFlags.append("🔍 OCR")
+                        if ExtractedMetadata['enhanced_extraction']:
+                            StatusFlags.append("⚡ Enhanced")
+                        if ExtractedMetadata['gpu_accelerated']:
+                            StatusFlags.append("🚀 GPU")
+                        if ExtractedMetadata.get('timeout_protection'):
+                            StatusFlags.append("⏰ Protected")
+                        
+                        # Add bibliographic flags
+                        BibFlags = []
+                        if ExtractedMetadata['extracted_isbn']:
+                            BibFlags.append("📚 ISBN")
+                        if ExtractedMetadata['extracted_lccn']:
+                            BibFlags.append("🏛️ LCCN")
+                        if ExtractedMetadata['extracted_issn']:
+                            BibFlags.append("📰 ISSN")
+                        if ExtractedMetadata['extracted_oclc']:
+                            BibFlags.append("🌐 OCLC")
+                        
+                        AllFlags = StatusFlags + BibFlags
+                        Status = " ".join(AllFlags) if AllFlags else "📄 Text"
+                        print(f"   ✅ Quality: {Quality:.0f}% | Time: {ProcessingTime:.1f}s | {Status}")
                     
-                    for Col in CSVColumns:
-                        if Col not in CorruptedMetadata:
-                            if Col in ['ocr_used', 'enhanced_extraction', 'gpu_accelerated']:
-                                CorruptedMetadata[Col] = False
-                            else:
-                                CorruptedMetadata[Col] = ''
+                    except TimeoutError:
+                        # Handle timeout gracefully
+                        print(f"   ⏰ TIMEOUT after {TOTAL_PDF_TIMEOUT}s - marking as corrupted PDF")
+                        
+                        CorruptedMetadata = {
+                            'filename': PDFFile.name,
+                            'file_size_mb': round(FileSize / (1024*1024), 2),
+                            'page_count': 0,
+                            'database_category': 'Corrupted',
+                            'database_subject': 'Corrupted',
+                            'pdf_title': 'CORRUPTED PDF - TIMEOUT',
+                            'extraction_method': 'Timeout Protection',
+                            'errors': f'Timeout after {TOTAL_PDF_TIMEOUT}s - likely corrupted PDF structure',
+                            'extraction_quality_score': 0,
+                            'processing_time_seconds': TOTAL_PDF_TIMEOUT,
+                            'timeout_protection': True
+                        }
+                        
+                        # Fill in missing fields with empty values
+                        CSVColumns = [
+                            'pdf_author', 'pdf_subject', 'pdf_creator', 'pdf_producer',
+                            'pdf_creation_date', 'extracted_isbn', 'extracted_lccn', 'extracted_issn',
+                            'extracted_oclc', 'extracted_year', 'extracted_publisher', 'extracted_edition', 
+                            'extracted_doi', 'first_page_text', 'title_page_text', 'copyright_page_text',
+                            'table_of_contents', 'full_text_sample', 'abstract_text', 'tables_content',
+                            'ocr_used', 'enhanced_extraction', 'hardware_acceleration', 'gpu_accelerated'
+                        ]
+                        
+                        for Col in CSVColumns:
+                            if Col not in CorruptedMetadata:
+                                if Col in ['ocr_used', 'enhanced_extraction', 'gpu_accelerated']:
+                                    CorruptedMetadata[Col] = False
+                                else:
+                                    CorruptedMetadata[Col] = ''
+                        
+                        self.AppendRow(CorruptedMetadata)
+                        self.TimeoutCount += 1
+                        self.CorruptedPDFCount += 1
+                        
+                        print(f"   🛡️ Timeout protection prevented infinite hang - continuing...")
                     
-                    self.AppendToCSV(CorruptedMetadata)
-                    self.TimeoutCount += 1
-                    self.CorruptedPDFCount += 1
+                    # Progress reporting
+                    if FileIndex % PROGRESS_INTERVAL == 0:
+                        CSVFile.flush()
+                        self.ShowHimalayaProgress(FileIndex, RemainingCount)
                     
-                    print(f"   🛡️ Timeout protection prevented infinite hang - continuing...")
-                
-                # Progress reporting
-                if FileIndex % PROGRESS_INTERVAL == 0:
-                    self.ShowHimalayaProgress(FileIndex, RemainingCount)
-                
-            except Exception as ProcessingError:
-                print(f"   ❌ Critical error processing {PDFFile.name}: {ProcessingError}")
-                self.ErrorCount += 1
-                continue
+                except Exception as ProcessingError:
+                    print(f"   ❌ Critical error processing {PDFFile.name}: {ProcessingError}")
+                    self.ErrorCount += 1
+                    continue
+        
+        self.CSVWriter = None
+        self.OutputDatabase = None
+        
+        self.HardwareManager.ReleaseOCREngines()
+        if self.OCRPool is not None:
+            self.OCRPool.shutdown()
+            self.OCRPool = None
+        if self.BookPool is not None:
+            self.BookPool.shutdown()
+            self.BookPool = None
         
         # Final reporting
         self.ShowHimalayaProgress(RemainingCount, RemainingCount)
@@ -1096,35 +1929,14 @@ class HimalayaPDFExtractor:
         
         return True
     
-    def AppendToCSV(self, BookData):
-        """Append record to Himalaya CSV with enhanced bibliographic fields"""
-        FileExists = os.path.exists(self.OutputFile)
-        
-        # Himalaya enhanced CSV columns with new bibliographic fields
-        Columns = [
-            'filename', 'file_size_mb', 'page_count',
-            'database_category', 'database_subject',
-            'pdf_title', 'pdf_author', 'pdf_subject', 'pdf_creator', 'pdf_producer',
-            'pdf_creation_date', 'extracted_isbn', 'extracted_lccn', 'extracted_issn',
-            'extracted_oclc', 'extracted_year', 'extracted_publisher', 'extracted_edition', 
-            'extracted_doi', 'first_page_text', 'title_page_text', 'copyright_page_text',
-            'table_of_contents', 'full_text_sample', 'abstract_text', 'tables_content',
-            'extraction_method', 'ocr_used', 'enhanced_extraction',
-            'hardware_acceleration', 'gpu_accelerated', 'timeout_protection',
-            'extraction_quality_score', 'processing_time_seconds', 'errors'
-        ]
-        
+    def AppendRow(self, BookData, ContentHash=None):
+        """Write a record to the CSV and queue it for the output database under its content key"""
         try:
-            with open(self.OutputFile, 'a', newline='', encoding='utf-8') as CSVFile:
-                Writer = csv.DictWriter(CSVFile, fieldnames=Columns)
-                
-                if not FileExists:
-                    Writer.writeheader()
-                
-                Writer.writerow(BookData)
-                
+            self.CSVWriter.writerow(BookData)
         except Exception as SaveError:
             print(f"❌ Error appending to CSV: {SaveError}")
+        
+        self.OutputDatabase.AddRow(BookData, ContentHash)
     
     def ShowHimalayaProgress(self, Current, Total):
         """Enhanced progress reporting with bibliographic metrics"""
@@ -4,11 +4,23 @@ GPU OCR Speed Test - Compare CPU vs GPU OCR performance
 """
 
 import time
+import numpy as np
 import torch
 from pathlib import Path
 import fitz  # PyMuPDF
-from pdf2image import convert_from_path
-import tempfile
+
+RENDER_DPI = 300
+
+def render_first_page(pdf_path):
+    """
+    Render page 1 in-process with PyMuPDF as an RGB (height, width, 3) array -
+    no poppler subprocess, temp PNG or decode
+    """
+    with fitz.open(pdf_path) as doc:
+        if len(doc) == 0:
+            return None
+        pix = doc[0].get_pixmap(dpi=RENDER_DPI, alpha=False)
+        return np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
 
 def test_gpu_availability():
     """Test if CUDA GPU is available"""
@@ -44,27 +56,26 @@ def test_easyocr_speed(pdf_path):
         # Initialize EasyOCR with GPU
         reader = easyocr.Reader(['en'], gpu=True)
         
-        # Convert first page to image
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pages = convert_from_path(pdf_path, first_page=1, last_page=1, dpi=300)
+        # Render first page
+        page = render_first_page(pdf_path)
+        
+        if page is not None:
+            start_time = time.time()
             
-            if pages:
-                start_time = time.time()
-                
-                # Perform OCR
-                results = reader.readtext(pages[0])
-                
-                end_time = time.time()
-                processing_time = end_time - start_time
-                
-                # Extract text
-                extracted_text = ' '.join([result[1] for result in results])
-                
-                print(f"⏱️ Processing time: {processing_time:.2f} seconds")
-                print(f"📄 Text extracted: {len(extracted_text)} characters")
-                print(f"📝 Sample: {extracted_text[:200]}...")
-                
-                return processing_time, len(extracted_text)
+            # Perform OCR
+            results = reader.readtext(page)
+            
+            end_time = time.time()
+            processing_time = end_time - start_time
+            
+            # Extract text
+            extracted_text = ' '.join([result[1] for result in results])
+            
+            print(f"⏱️ Processing time: {processing_time:.2f} seconds")
+            print(f"📄 Text extracted: {len(extracted_text)} characters")
+            print(f"📝 Sample: {extracted_text[:200]}...")
+            
+            return processing_time, len(extracted_text)
                 
     except ImportError:
         print("❌ EasyOCR not installed. Install with: pip install easyocr")
@@ -81,24 +92,23 @@ def test_tesseract_speed(pdf_path):
         print("\n🐌 TESTING TESSERACT (CPU)")
         print("=" * 40)
         
-        # Convert first page to image
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pages = convert_from_path(pdf_path, first_page=1, last_page=1, dpi=300)
+        # Render first page
+        page = render_first_page(pdf_path)
+        
+        if page is not None:
+            start_time = time.time()
             
-            if pages:
-                start_time = time.time()
-                
-                # Perform OCR
-                extracted_text = pytesseract.image_to_string(pages[0])
-                
-                end_time = time.time()
-                processing_time = end_time - start_time
-                
-                print(f"⏱️ Processing time: {processing_time:.2f} seconds")
-                print(f"📄 Text extracted: {len(extracted_text)} characters")
-                print(f"📝 Sample: {extracted_text[:200]}...")
-                
-                return processing_time, len(extracted_text)
+            # Perform OCR
+            extracted_text = pytesseract.image_to_string(page)
+            
+            end_time = time.time()
+            processing_time = end_time - start_time
+            
+            print(f"⏱️ Processing time: {processing_time:.2f} seconds")
+            print(f"📄 Text extracted: {len(extracted_text)} characters")
+            print(f"📝 Sample: {extracted_text[:200]}...")
+            
+            return processing_time, len(extracted_text)
                 
     except Exception as e:
         print(f"❌ Tesseract test failed: {e}")
@@ -115,33 +125,32 @@ def test_paddleocr_speed(pdf_path):
         # Initialize PaddleOCR with GPU
         ocr = PaddleOCR(use_angle_cls=True, lang='en', use_gpu=True)
         
-        # Convert first page to image
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pages = convert_from_path(pdf_path, first_page=1, last_page=1, dpi=300)
+        # Render first page
+        page = render_first_page(pdf_path)
+        
+        if page is not None:
+            # Hand PaddleOCR the pixels directly (BGR, as it expects) - no PNG
+            # encode, temp file or decode inside the timed call
+            img = np.ascontiguousarray(page[:, :, ::-1])
             
-            if pages:
-                # Save image temporarily
-                img_path = f"{temp_dir}/test_page.png"
-                pages[0].save(img_path)
-                
-                start_time = time.time()
-                
-                # Perform OCR
-                results = ocr.ocr(img_path, cls=True)
-                
-                end_time = time.time()
-                processing_time = end_time - start_time
-                
-                # Extract text
-                extracted_text = ''
-                if results and results[0]:
-                    extracted_text = ' '.join([line[1][0] for line in results[0]])
-                
-                print(f"⏱️ Processing time: {processing_time:.2f} seconds")
-                print(f"📄 Text extracted: {len(extracted_text)} characters")
-                print(f"📝 Sample: {extracted_text[:200]}...")
-                
-                return processing_time, len(extracted_text)
+            start_time = time.time()
+            
+            # Perform OCR
+            results = ocr.ocr(img, cls=True)
+            
+            end_time = time.time()
+            processing_time = end_time - start_time
+            
+            # Extract text
+            extracted_text = ''
+            if results and results[0]:
+                extracted_text = ' '.join([line[1][0] for line in results[0]])
+            
+            print(f"⏱️ Processing time: {processing_time:.2f} seconds")
+            print(f"📄 Text extracted: {len(extracted_text)} characters")
+            print(f"📝 Sample: {extracted_text[:200]}...")
+            
+            return processing_time, len(extracted_text)
                 
     except ImportError:
         print("❌ PaddleOCR not installed. Install with: pip install paddlepaddle-gpu paddleocr")